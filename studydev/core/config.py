@@ -4,124 +4,260 @@ Handles all configuration settings, paths, and user preferences
 """
 
 import os
+import copy
 import json
+import atexit
+from functools import lru_cache, cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
-from rich.console import Console
+from typing import Dict, Any, Optional, Set, Tuple
 
-console = Console()
+from studydev.core import serialization
+from studydev.core.console import get_console
+
+# Parsed config files shared across Config instances, keyed by path -> (mtime_ns, config)
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+# Default settings; Config._default_config deep-copies this and fills in paths
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "user": {
+        "name": "",
+        "timezone": "UTC",
+        "preferred_editor": "nano"
+    },
+    "session": {
+        "pomodoro_duration": 25,  # minutes
+        "short_break": 5,         # minutes
+        "long_break": 15,         # minutes
+        "long_break_after": 4,    # sessions
+        "auto_start_breaks": False,
+        "notification_sound": True
+    },
+    "project": {
+        "default_git_init": True,
+        "auto_readme": True,
+        "default_license": "MIT",
+        "template_path": None  # filled in per Config from data_dir
+    },
+    "study": {
+        "flashcard_review_interval": 7,  # days
+        "bookmark_categories": [
+            "Programming", 
+            "Mathematics", 
+            "Science", 
+            "Documentation",
+            "Tutorials",
+            "Research"
+        ],
+        "course_progress_tracking": True
+    },
+    "ui": {
+        "theme": "default",
+        "show_progress_bars": True,
+        "rich_output": True,
+        "compact_mode": False
+    },
+    "data": {
+        "auto_backup": True,
+        "backup_frequency": "daily",  # daily, weekly, monthly
+        "keep_backups": 30,  # number of backups to keep
+        "export_format": "json"  # json, csv, yaml
+    }
+}
+
+# Sentinel for missing keys in Config.get (None is a valid stored value)
+_MISSING = object()
 
 class Config:
     """Configuration manager for StudyDev"""
     
+    # Directories already created in this process
+    _dirs_ready: Set[Path] = set()
+    
     def __init__(self):
         self.home_path = Path.home()
         self.config_dir = self.home_path / ".studydev"
         self.config_file = self.config_dir / "config.json"
         self.data_dir = self.config_dir / "data"
         
+        # String forms of the fixed paths, built once
+        self._config_path = str(self.config_file)
+        self._data_path = str(self.data_dir)
+        self._database_path = str(self.data_dir / "studydev.db")
+        
         # Ensure directories exist
         self._ensure_directories()
         
         # Load or create configuration
         self._config = self._load_config()
+        
+        # Memoized dot-notation lookups
+        self._path_cache: Dict[str, Tuple[str, ...]] = {}
+        self._value_cache: Dict[str, Any] = {}
+        
+        # Pending changes are written by flush() (at the latest on interpreter exit)
+        self._dirty = False
+        self._flush_registered = False
     
     def _ensure_directories(self):
         """Create necessary directories if they don't exist"""
+        if self.config_dir in Config._dirs_ready:
+            return
+        
         self.config_dir.mkdir(exist_ok=True)
         self.data_dir.mkdir(exist_ok=True)
         
-        # Create subdirectories for different data types
-        (self.data_dir / "sessions").mkdir(exist_ok=True)
-        (self.data_dir / "projects").mkdir(exist_ok=True)
-        (self.data_dir / "study_materials").mkdir(exist_ok=True)
-        (self.data_dir / "templates").mkdir(exist_ok=True)
-        (self.data_dir / "backups").mkdir(exist_ok=True)
+        # Data subdirectories are created on first access (see _data_subdir)
+        Config._dirs_ready.add(self.config_dir)
+    
+    def _data_subdir(self, name: str) -> Path:
+        """Get a data subdirectory, creating it the first time it is requested"""
+        path = self.data_dir / name
+        if path not in Config._dirs_ready:
+            path.mkdir(parents=True, exist_ok=True)
+            Config._dirs_ready.add(path)
+        return path
+    
+    @cached_property
+    def sessions_dir(self) -> Path:
+        """Directory for session data"""
+        return self._data_subdir("sessions")
+    
+    @cached_property
+    def projects_dir(self) -> Path:
+        """Directory for project data"""
+        return self._data_subdir("projects")
+    
+    @cached_property
+    def study_materials_dir(self) -> Path:
+        """Directory for study materials"""
+        return self._data_subdir("study_materials")
+    
+    @cached_property
+    def templates_dir(self) -> Path:
+        """Directory for templates"""
+        return self._data_subdir("templates")
+    
+    @cached_property
+    def backups_dir(self) -> Path:
+        """Directory for backups"""
+        return self._data_subdir("backups")
+    
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Directory for disposable cached data"""
+        return self._data_subdir("cache")
+    
+    def _file_mtime_ns(self) -> Optional[int]:
+        """Get the config file's mtime, or None if it doesn't exist"""
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
-        if self.config_file.exists():
+        mtime_ns = self._file_mtime_ns()
+        
+        cached = _CONFIG_CACHE.get(self.config_file)
+        if cached and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+        
+        if mtime_ns is not None:
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                config = serialization.loads(self.config_file.read_bytes())
+                _CONFIG_CACHE[self.config_file] = (mtime_ns, copy.deepcopy(config))
+                return config
             except (json.JSONDecodeError, IOError) as e:
-                console.print(f"⚠️  Warning: Could not load config file: {e}")
-                console.print("Using default configuration...")
+                get_console().print(f"⚠️  Warning: Could not load config file: {e}")
+                get_console().print("Using default configuration...")
         
         return self._default_config()
     
     def _default_config(self) -> Dict[str, Any]:
         """Return default configuration settings"""
-        return {
-            "user": {
-                "name": "",
-                "timezone": "UTC",
-                "preferred_editor": "nano"
-            },
-            "session": {
-                "pomodoro_duration": 25,  # minutes
-                "short_break": 5,         # minutes
-                "long_break": 15,         # minutes
-                "long_break_after": 4,    # sessions
-                "auto_start_breaks": False,
-                "notification_sound": True
-            },
-            "project": {
-                "default_git_init": True,
-                "auto_readme": True,
-                "default_license": "MIT",
-                "template_path": str(self.data_dir / "templates")
-            },
-            "study": {
-                "flashcard_review_interval": 7,  # days
-                "bookmark_categories": [
-                    "Programming", 
-                    "Mathematics", 
-                    "Science", 
-                    "Documentation",
-                    "Tutorials",
-                    "Research"
-                ],
-                "course_progress_tracking": True
-            },
-            "ui": {
-                "theme": "default",
-                "show_progress_bars": True,
-                "rich_output": True,
-                "compact_mode": False
-            },
-            "data": {
-                "auto_backup": True,
-                "backup_frequency": "daily",  # daily, weekly, monthly
-                "keep_backups": 30,  # number of backups to keep
-                "export_format": "json"  # json, csv, yaml
-            }
-        }
+        config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+        config["project"]["template_path"] = str(self.data_dir / "templates")
+        return config
     
     def save_config(self):
         """Save current configuration to file"""
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config, f, indent=4, sort_keys=True)
+            tmp_file.write_bytes(serialization.dumps(self._config, indent=True, sort_keys=True))
+            
+            # Atomic swap so readers never see a half-written file
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
+            self._update_cache()
         except IOError as e:
-            console.print(f"❌ Error saving config: {e}")
+            get_console().print(f"❌ Error saving config: {e}")
             raise
     
+    def flush(self):
+        """Write pending configuration changes to disk"""
+        if self._dirty:
+            self.save_config()
+    
+    def _update_cache(self):
+        """Record the configuration just written so other instances skip re-reading it"""
+        _CONFIG_CACHE[self.config_file] = (
+            self._file_mtime_ns(),
+            copy.deepcopy(self._config)
+        )
+    
+    def _split_path(self, key_path: str) -> Tuple[str, ...]:
+        """Split a dot-notation key path, memoizing the result"""
+        keys = self._path_cache.get(key_path)
+        if keys is None:
+            keys = self._path_cache[key_path] = tuple(key_path.split('.'))
+        return keys
+    
+    def _invalidate(self, key_path: str):
+        """Drop cached values for a key path, its parents and its children"""
+        prefix = key_path + '.'
+        for cached_path in list(self._value_cache):
+            if (cached_path == key_path or cached_path.startswith(prefix)
+                    or key_path.startswith(cached_path + '.')):
+                del self._value_cache[cached_path]
+    
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'session.pomodoro_duration')"""
-        keys = key_path.split('.')
+        if key_path in self._value_cache:
+            return self._value_cache[key_path]
+        
+        keys = self._split_path(key_path)
         value = self._config
         
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        for key in keys:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+        
+        self._value_cache[key_path] = value
+        return value
     
     def set(self, key_path: str, value: Any):
         """Set configuration value using dot notation"""
-        keys = key_path.split('.')
+        self._assign(key_path, value)
+        self._dirty = True
+        
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+    
+    def batch_set(self, values: Dict[str, Any]):
+        """Set several dot-notation values and write the file once"""
+        for key_path, value in values.items():
+            self._assign(key_path, value)
+        self.save_config()
+    
+    def _assign(self, key_path: str, value: Any):
+        """Set a value in the in-memory configuration"""
+        keys = self._split_path(key_path)
+        self._invalidate(key_path)
         config = self._config
         
         # Navigate to the parent dictionary
@@ -130,38 +266,44 @@ class Config:
                 config[key] = {}
             config = config[key]
         
-        # Set the final value
+        # Set the final value; the file is written on flush()
         config[keys[-1]] = value
-        self.save_config()
     
     @property
     def config_path(self) -> str:
         """Get the configuration file path"""
-        return str(self.config_file)
+        return self._config_path
     
     @property  
     def data_path(self) -> str:
         """Get the data directory path"""
-        return str(self.data_dir)
+        return self._data_path
     
     @property
     def database_path(self) -> str:
         """Get the database file path"""
-        return str(self.data_dir / "studydev.db")
+        return self._database_path
     
     def get_template_path(self, template_name: str) -> str:
         """Get path for a specific template"""
-        return str(self.data_dir / "templates" / f"{template_name}.json")
+        return str(self.templates_dir / f"{template_name}.json")
     
     def get_backup_path(self, backup_name: str) -> str:
         """Get path for a specific backup"""
-        return str(self.data_dir / "backups" / backup_name)
+        return str(self.backups_dir / backup_name)
     
     def reset_to_defaults(self):
         """Reset configuration to default values"""
         self._config = self._default_config()
+        self._value_cache.clear()
         self.save_config()
-        console.print("🔄 Configuration reset to defaults")
+        get_console().print("🔄 Configuration reset to defaults")
+    
+    @classmethod
+    def reload(cls):
+        """Drop the shared instance so the next get_config() re-reads from disk"""
+        get_config.cache_clear()
+        _CONFIG_CACHE.clear()
     
     def display_config(self):
         """Display current configuration in a readable format"""
@@ -178,4 +320,10 @@ class Config:
             else:
                 section_tree.add(f"[bold blue]{settings}[/bold blue]")
         
-        console.print(tree)
\ No newline at end of file
+        get_console().print(tree)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared Config instance for this process"""
+    return Config()
@@ -0,0 +1,13 @@
+"""
+StudyDev Console Access
+Defers importing rich until something is actually printed
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_console():
+    """Get the shared rich Console, importing rich on first use"""
+    from rich.console import Console
+    return Console()
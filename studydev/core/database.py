@@ -3,175 +3,260 @@ StudyDev Database Management System
 Handles all data persistence using SQLite
 """
 
+import os
 import sqlite3
 import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator, Callable
 from contextlib import contextmanager
+from functools import lru_cache
 
-from studydev.core.config import Config
-from rich.console import Console
+from studydev.core.config import get_config
+from studydev.core.console import get_console
 
-console = Console()
+# Bump whenever _SCHEMA_SQL changes so existing databases pick it up
+SCHEMA_VERSION = 6
+
+# Schema for all tables and indexes, applied as a single script
+_SCHEMA_SQL = """
+-- Sessions table for time tracking
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_type TEXT NOT NULL CHECK(session_type IN ('study', 'break', 'project')),
+    project_id INTEGER,
+    subject TEXT,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    duration INTEGER, -- in seconds
+    notes TEXT,
+    productivity_rating INTEGER CHECK(productivity_rating BETWEEN 1 AND 5),
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (project_id) REFERENCES projects (id)
+);
+
+-- Range scans on start_time also check the "finished" filter (end_time IS NOT NULL) in the index
+DROP INDEX IF EXISTS idx_sessions_start_time;
+CREATE INDEX IF NOT EXISTS idx_sessions_start_end ON sessions(start_time, end_time);
+CREATE INDEX IF NOT EXISTS idx_sessions_project_id ON sessions(project_id);
+-- Covering index: session_type filters plus the get_stats aggregates never touch the table
+DROP INDEX IF EXISTS idx_sessions_type;
+CREATE INDEX IF NOT EXISTS idx_sessions_type_start_duration ON sessions(session_type, start_time, duration);
+
+-- Projects table for academic/coding projects
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    project_type TEXT NOT NULL CHECK(project_type IN ('academic', 'personal', 'work')),
+    language TEXT, -- Programming language if applicable
+    path TEXT, -- Local file system path
+    git_repo TEXT, -- Git repository URL
+    deadline TEXT, -- ISO format date
+    status TEXT NOT NULL DEFAULT 'active' CHECK(status IN ('active', 'completed', 'paused', 'cancelled')),
+    priority INTEGER DEFAULT 3 CHECK(priority BETWEEN 1 AND 5),
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_projects_status_priority ON projects(status, priority);
+-- Partial index for deadline listings; projects without a deadline are left out and
+-- status rides along so open-deadline filters are checked without reading the table
+DROP INDEX IF EXISTS idx_projects_deadline;
+CREATE INDEX IF NOT EXISTS idx_projects_deadline_status ON projects(deadline, status) WHERE deadline IS NOT NULL;
+
+-- Study materials table
+CREATE TABLE IF NOT EXISTS study_materials (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT,
+    material_type TEXT NOT NULL CHECK(material_type IN ('note', 'reference', 'summary', 'exercise')),
+    subject TEXT NOT NULL,
+    tags TEXT, -- JSON array of tags
+    file_path TEXT, -- Path to associated file
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Full-text index over study materials, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS study_materials_fts USING fts5(
+    title, content, content='study_materials', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS study_materials_fts_insert AFTER INSERT ON study_materials BEGIN
+    INSERT INTO study_materials_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_materials_fts_delete AFTER DELETE ON study_materials BEGIN
+    INSERT INTO study_materials_fts(study_materials_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_materials_fts_update AFTER UPDATE ON study_materials BEGIN
+    INSERT INTO study_materials_fts(study_materials_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO study_materials_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+-- Index rows that existed before the FTS table was added
+INSERT INTO study_materials_fts(study_materials_fts) VALUES ('rebuild');
+
+-- Flashcards table for spaced repetition
+CREATE TABLE IF NOT EXISTS flashcards (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    difficulty INTEGER DEFAULT 3 CHECK(difficulty BETWEEN 1 AND 5),
+    last_reviewed TEXT,
+    next_review TEXT,
+    review_count INTEGER DEFAULT 0,
+    correct_streak INTEGER DEFAULT 0,
+    tags TEXT, -- JSON array of tags
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_flashcards_next_review ON flashcards(next_review);
+CREATE INDEX IF NOT EXISTS idx_flashcards_subject ON flashcards(subject);
+
+-- Bookmarks table for study resources
+CREATE TABLE IF NOT EXISTS bookmarks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    description TEXT,
+    category TEXT NOT NULL,
+    tags TEXT, -- JSON array of tags
+    is_read BOOLEAN DEFAULT FALSE,
+    rating INTEGER CHECK(rating BETWEEN 1 AND 5),
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    accessed_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_bookmarks_category ON bookmarks(category);
+
+-- Courses table for online course tracking
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    platform TEXT, -- Coursera, Udemy, etc.
+    instructor TEXT,
+    url TEXT,
+    total_lessons INTEGER,
+    completed_lessons INTEGER DEFAULT 0,
+    progress_percentage REAL DEFAULT 0.0,
+    status TEXT NOT NULL DEFAULT 'enrolled' CHECK(status IN ('enrolled', 'in_progress', 'completed', 'paused')),
+    start_date TEXT,
+    target_completion_date TEXT,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_STATS_TABLES = ('sessions', 'projects', 'study_materials', 'flashcards', 'bookmarks', 'courses')
+
+_STATS_SQL = "SELECT " + ", ".join(
+    [f"(SELECT COUNT(*) FROM {table})" for table in _STATS_TABLES] + [
+        "(SELECT COALESCE(SUM(duration), 0) FROM sessions WHERE session_type = 'study')",
+        "(SELECT COUNT(DISTINCT DATE(start_time)) FROM sessions WHERE session_type = 'study')",
+    ]
+)
+
+# Reusable cursors kept per thread, keyed by SQL string (matches cached_statements)
+_CURSOR_CACHE_SIZE = 512
+
+# Pages copied per step of an online backup (4 MB with the default 4 KB page size)
+_BACKUP_PAGES = 1024
 
 class Database:
     """Database manager for StudyDev using SQLite"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.db_path = self.config.database_path
+        self._local = threading.local()
+        self._write_gen = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_key: Optional[Tuple[int, int]] = None
         self._init_database()
     
     def _init_database(self):
         """Initialize database with all required tables"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version == SCHEMA_VERSION:
+                    return
                 
-                # Create all tables
-                self._create_sessions_table(cursor)
-                self._create_projects_table(cursor)
-                self._create_study_materials_table(cursor)
-                self._create_flashcards_table(cursor)
-                self._create_bookmarks_table(cursor)
-                self._create_courses_table(cursor)
-                
-                conn.commit()
+                # Create all tables and indexes in one transaction
+                conn.executescript(
+                    f"BEGIN;\n{_SCHEMA_SQL}\n"
+                    f"PRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+                )
                 
         except sqlite3.Error as e:
-            console.print(f"❌ Database initialization error: {e}")
+            get_console().print(f"❌ Database initialization error: {e}")
             raise
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection tuned for a local single-user database"""
+        # Autocommit mode: single statements commit on their own and
+        # multi-statement writes issue an explicit BEGIN
+        # Rows come back as plain tuples; execute_query opts into sqlite3.Row
+        conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=512)
+        
+        # WAL lets stats/history reads run while a session write is in progress;
+        # NORMAL only risks the last commits on power loss, never corruption
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Wait for a competing writer (e.g. another studydev process) instead of failing
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        conn.execute("PRAGMA cache_size=-65536")    # 64 MB
+        
+        return conn
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Persistent connection for the calling thread, opened on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+    
+    def _cursor(self, conn: sqlite3.Connection, query: str) -> sqlite3.Cursor:
+        """Get the calling thread's reusable cursor for a SQL string"""
+        cursors = getattr(self._local, "cursors", None)
+        if cursors is None:
+            cursors = self._local.cursors = {}
+        
+        cursor = cursors.get(query)
+        if cursor is None:
+            if len(cursors) >= _CURSOR_CACHE_SIZE:
+                cursors.clear()
+            cursor = cursors[query] = conn.cursor()
+        return cursor
+    
     @contextmanager
     def _get_connection(self):
-        """Get database connection with automatic cleanup"""
-        conn = None
+        """Get the persistent connection, rolling back open transactions on error"""
+        conn = self.conn
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable column access by name
             yield conn
         except sqlite3.Error as e:
-            if conn:
+            if conn.in_transaction:
                 conn.rollback()
             raise e
-        finally:
-            if conn:
-                conn.close()
-    
-    def _create_sessions_table(self, cursor):
-        """Create sessions table for time tracking"""
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_type TEXT NOT NULL CHECK(session_type IN ('study', 'break', 'project')),
-                project_id INTEGER,
-                subject TEXT,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                duration INTEGER, -- in seconds
-                notes TEXT,
-                productivity_rating INTEGER CHECK(productivity_rating BETWEEN 1 AND 5),
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects (id)
-            )
-        """)
-        
-        # Create indexes for better performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON sessions(start_time)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_project_id ON sessions(project_id)")
     
-    def _create_projects_table(self, cursor):
-        """Create projects table for academic/coding projects"""
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                description TEXT,
-                project_type TEXT NOT NULL CHECK(project_type IN ('academic', 'personal', 'work')),
-                language TEXT, -- Programming language if applicable
-                path TEXT, -- Local file system path
-                git_repo TEXT, -- Git repository URL
-                deadline TEXT, -- ISO format date
-                status TEXT NOT NULL DEFAULT 'active' CHECK(status IN ('active', 'completed', 'paused', 'cancelled')),
-                priority INTEGER DEFAULT 3 CHECK(priority BETWEEN 1 AND 5),
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-    
-    def _create_study_materials_table(self, cursor):
-        """Create study materials table"""
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS study_materials (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                material_type TEXT NOT NULL CHECK(material_type IN ('note', 'reference', 'summary', 'exercise')),
-                subject TEXT NOT NULL,
-                tags TEXT, -- JSON array of tags
-                file_path TEXT, -- Path to associated file
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-    
-    def _create_flashcards_table(self, cursor):
-        """Create flashcards table for spaced repetition"""
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS flashcards (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                question TEXT NOT NULL,
-                answer TEXT NOT NULL,
-                subject TEXT NOT NULL,
-                difficulty INTEGER DEFAULT 3 CHECK(difficulty BETWEEN 1 AND 5),
-                last_reviewed TEXT,
-                next_review TEXT,
-                review_count INTEGER DEFAULT 0,
-                correct_streak INTEGER DEFAULT 0,
-                tags TEXT, -- JSON array of tags
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_flashcards_next_review ON flashcards(next_review)")
-    
-    def _create_bookmarks_table(self, cursor):
-        """Create bookmarks table for study resources"""
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bookmarks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                url TEXT NOT NULL,
-                description TEXT,
-                category TEXT NOT NULL,
-                tags TEXT, -- JSON array of tags
-                is_read BOOLEAN DEFAULT FALSE,
-                rating INTEGER CHECK(rating BETWEEN 1 AND 5),
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                accessed_at TEXT
-            )
-        """)
-    
-    def _create_courses_table(self, cursor):
-        """Create courses table for online course tracking"""
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS courses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                platform TEXT, -- Coursera, Udemy, etc.
-                instructor TEXT,
-                url TEXT,
-                total_lessons INTEGER,
-                completed_lessons INTEGER DEFAULT 0,
-                progress_percentage REAL DEFAULT 0.0,
-                status TEXT NOT NULL DEFAULT 'enrolled' CHECK(status IN ('enrolled', 'in_progress', 'completed', 'paused')),
-                start_date TEXT,
-                target_completion_date TEXT,
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            self._local.cursors = None
     
     def is_connected(self) -> bool:
         """Check if database connection is working"""
@@ -183,42 +268,44 @@ class Database:
         except sqlite3.Error:
             return False
     
+    def _stats_key(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        """Change marker covering writes from this instance and other connections"""
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self._write_gen, data_version)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         stats = {}
         
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
+                key = self._stats_key(conn)
+                if self._stats_cache is not None and self._stats_cache_key == key:
+                    return dict(self._stats_cache)
                 
-                # Count records in each table
-                tables = ['sessions', 'projects', 'study_materials', 'flashcards', 'bookmarks', 'courses']
+                cursor = conn.cursor()
                 
-                for table in tables:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    stats[table] = cursor.fetchone()[0]
+                # Count records in each table plus study aggregates in one round trip
+                cursor.execute(_STATS_SQL)
+                row = cursor.fetchone()
                 
-                # Additional stats
-                cursor.execute("""
-                    SELECT 
-                        COALESCE(SUM(duration), 0) as total_study_time,
-                        COUNT(DISTINCT DATE(start_time)) as study_days
-                    FROM sessions 
-                    WHERE session_type = 'study'
-                """)
+                stats = dict(zip(_STATS_TABLES, row))
+                total_study_time, study_days = row[len(_STATS_TABLES):]
+                stats['total_study_time_seconds'] = total_study_time or 0
+                stats['study_days'] = study_days or 0
+                stats['total_study_time_hours'] = round((total_study_time or 0) / 3600, 2)
                 
-                result = cursor.fetchone()
-                stats['total_study_time_seconds'] = result[0] or 0
-                stats['study_days'] = result[1] or 0
-                stats['total_study_time_hours'] = round((result[0] or 0) / 3600, 2)
+                self._stats_cache = dict(stats)
+                self._stats_cache_key = key
                 
         except sqlite3.Error as e:
-            console.print(f"❌ Error getting stats: {e}")
+            get_console().print(f"❌ Error getting stats: {e}")
             
         return stats
     
-    def backup_database(self, backup_path: str = None) -> str:
-        """Create a backup of the database"""
+    def backup_database(self, backup_path: str = None, compact: bool = False,
+                        progress: Optional[Callable[[int, int], None]] = None) -> str:
+        """Create a backup of the database, optionally compacted with VACUUM INTO"""
         if not backup_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.config.get_backup_path(f"studydev_backup_{timestamp}.db")
@@ -227,18 +314,27 @@ class Database:
             # Create backup directory if it doesn't exist
             Path(backup_path).parent.mkdir(parents=True, exist_ok=True)
             
-            with sqlite3.connect(self.db_path) as source:
-                with sqlite3.connect(backup_path) as backup:
-                    source.backup(backup)
+            if compact:
+                # Single statement that also defragments the copy
+                self.conn.execute("VACUUM INTO ?", (backup_path,))
+            else:
+                # Copy in page batches so writers are not blocked for the whole
+                # backup; progress(copied, total) is reported after each batch
+                backup = sqlite3.connect(backup_path)
+                try:
+                    self.conn.backup(backup, **self._backup_options(progress))
+                finally:
+                    backup.close()
             
-            console.print(f"✅ Database backed up to: {backup_path}")
+            get_console().print(f"✅ Database backed up to: {backup_path}")
             return backup_path
             
         except sqlite3.Error as e:
-            console.print(f"❌ Backup failed: {e}")
+            get_console().print(f"❌ Backup failed: {e}")
             raise
     
-    def restore_database(self, backup_path: str):
+    def restore_database(self, backup_path: str,
+                         progress: Optional[Callable[[int, int], None]] = None):
         """Restore database from backup"""
         if not Path(backup_path).exists():
             raise FileNotFoundError(f"Backup file not found: {backup_path}")
@@ -246,38 +342,140 @@ class Database:
         try:
             # Create a backup of current database first
             current_backup = self.backup_database()
-            console.print(f"📦 Current database backed up to: {current_backup}")
+            get_console().print(f"📦 Current database backed up to: {current_backup}")
             
             # Restore from backup
-            with sqlite3.connect(backup_path) as source:
-                with sqlite3.connect(self.db_path) as target:
-                    source.backup(target)
+            source = sqlite3.connect(backup_path)
+            try:
+                source.backup(self.conn, **self._backup_options(progress))
+            finally:
+                source.close()
+            self._write_gen += 1
             
-            console.print(f"✅ Database restored from: {backup_path}")
+            get_console().print(f"✅ Database restored from: {backup_path}")
             
         except sqlite3.Error as e:
-            console.print(f"❌ Restore failed: {e}")
+            get_console().print(f"❌ Restore failed: {e}")
             raise
     
+    @staticmethod
+    def _backup_options(progress: Optional[Callable[[int, int], None]]) -> Dict[str, Any]:
+        """Keyword arguments for a paged sqlite3 backup"""
+        options: Dict[str, Any] = {"pages": _BACKUP_PAGES, "sleep": 0.001}
+        if progress is not None:
+            options["progress"] = lambda status, remaining, total: progress(total - remaining, total)
+        return options
+    
     def execute_query(self, query: str, params: Tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query and return results"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._cursor(conn, query)
+                cursor.row_factory = sqlite3.Row  # Enable column access by name
                 cursor.execute(query, params)
                 return cursor.fetchall()
         except sqlite3.Error as e:
-            console.print(f"❌ Query execution failed: {e}")
+            get_console().print(f"❌ Query execution failed: {e}")
+            raise
+    
+    def execute_query_batches(self, query: str, params: Tuple = (),
+                              batch_size: int = 1000) -> Iterator[List[sqlite3.Row]]:
+        """Execute a SELECT query and yield its rows in lists of up to batch_size"""
+        try:
+            with self._get_connection() as conn:
+                # Dedicated cursor: the caller may run other queries between batches
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row  # Enable column access by name
+                cursor.arraysize = batch_size
+                cursor.execute(query, params)
+                
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    yield rows
+        except sqlite3.Error as e:
+            get_console().print(f"❌ Query execution failed: {e}")
             raise
     
+    def execute_query_iter(self, query: str, params: Tuple = (),
+                           batch_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """Execute a SELECT query and yield rows without loading them all at once"""
+        for rows in self.execute_query_batches(query, params, batch_size):
+            yield from rows
+    
     def execute_update(self, query: str, params: Tuple = ()) -> int:
         """Execute an INSERT/UPDATE/DELETE query and return affected rows"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._cursor(conn, query)
                 cursor.execute(query, params)
                 conn.commit()
+                self._write_gen += 1
                 return cursor.rowcount
         except sqlite3.Error as e:
-            console.print(f"❌ Update execution failed: {e}")
-            raise
\ No newline at end of file
+            get_console().print(f"❌ Update execution failed: {e}")
+            raise
+    
+    def execute_insert(self, query: str, params: Tuple = ()) -> int:
+        """Execute an INSERT query and return the id of the new row"""
+        try:
+            with self._get_connection() as conn:
+                cursor = self._cursor(conn, query)
+                cursor.execute(query, params)
+                conn.commit()
+                self._write_gen += 1
+                return cursor.lastrowid
+        except sqlite3.Error as e:
+            get_console().print(f"❌ Insert execution failed: {e}")
+            raise
+    
+    def execute_many(self, query: str, params_seq: Iterable[Tuple]) -> int:
+        """Execute an INSERT/UPDATE/DELETE for many parameter sets in one transaction"""
+        # transaction() rolls back on any exception, including one raised by params_seq
+        with self.transaction() as cursor:
+            cursor.executemany(query, params_seq)
+        return cursor.rowcount
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run several writes as one BEGIN IMMEDIATE ... COMMIT, rolling back on any error"""
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn.cursor()
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            get_console().print(f"❌ Transaction failed: {e}")
+            raise
+        except BaseException:
+            conn.rollback()
+            raise
+        self._write_gen += 1
+
+
+def database_file_marker(db_path: Optional[str] = None) -> Tuple[Optional[int], ...]:
+    """Modification times of the database file and its WAL; any committed write changes one of them"""
+    if db_path is None:
+        db_path = get_config().database_path
+    
+    try:
+        db_mtime = os.stat(db_path).st_mtime_ns
+    except OSError:
+        db_mtime = None
+    
+    # Opening a connection recreates an empty WAL, so only a WAL holding frames counts
+    try:
+        wal_stat = os.stat(db_path + "-wal")
+        wal_mtime = wal_stat.st_mtime_ns if wal_stat.st_size else None
+    except OSError:
+        wal_mtime = None
+    
+    return (db_mtime, wal_mtime)
+
+
+@lru_cache(maxsize=1)
+def get_db() -> Database:
+    """Get the shared Database instance for this process"""
+    return Database()
@@ -4,24 +4,81 @@ StudyDev - Ultimate Student & Developer Productivity CLI Tool
 Main entry point and command dispatcher
 """
 
+import importlib
+import math
+import os
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
 import typer
+from typer.core import TyperGroup
 from rich.console import Console
-from rich.text import Text
-from rich.panel import Panel
-from rich.prompt import Confirm
-from rich.table import Table
-from rich import box
-
-from studydev.core.config import Config
-from studydev.core.database import Database
-from studydev.modules.session.commands import session_app
-from studydev.modules.project.commands import project_app
-from studydev.modules.study.commands import study_app
-from studydev.utils.interactive import InteractiveUI
-
-# Initialize Rich console and interactive UI
+
+from studydev.core import serialization
+from studydev.core.config import get_config
+
+# Initialize Rich console
 console = Console()
-interactive_ui = InteractiveUI()
+
+# Sub-applications, imported only when their command is invoked:
+# name -> (module, attribute, help)
+_LAZY_SUBAPPS = {
+    "session": ("studydev.modules.session.commands", "session_app", "📚 Study & Dev Session Manager"),
+    "project": ("studydev.modules.project.commands", "project_app", "📝 Academic Project Organizer"),
+    "study": ("studydev.modules.study.commands", "study_app", "🔖 Study Material Aggregator"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Top-level command group that loads sub-applications on first use"""
+    
+    def list_commands(self, ctx):
+        return list(_LAZY_SUBAPPS) + [
+            name for name in super().list_commands(ctx) if name not in _LAZY_SUBAPPS
+        ]
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in _LAZY_SUBAPPS and cmd_name not in self.commands:
+            # Help and listings only need the name and help text, so don't import the module
+            return TyperGroup(name=cmd_name, help=_LAZY_SUBAPPS[cmd_name][2])
+        
+        return super().get_command(ctx, cmd_name)
+    
+    def resolve_command(self, ctx, args):
+        if args and args[0] in _LAZY_SUBAPPS:
+            self._load_subapp(args[0])
+        
+        return super().resolve_command(ctx, args)
+    
+    def _load_subapp(self, cmd_name):
+        """Import a sub-application and register it under its command name"""
+        if cmd_name in self.commands:
+            return
+        
+        module_name, attr, help_text = _LAZY_SUBAPPS[cmd_name]
+        sub_app = getattr(importlib.import_module(module_name), attr)
+        
+        command = typer.main.get_group(sub_app)
+        command.name = cmd_name
+        command.help = help_text
+        self.add_command(command, cmd_name)
+
+
+@lru_cache(maxsize=1)
+def get_interactive_ui():
+    """Get the shared InteractiveUI, importing it on first use"""
+    from studydev.utils.interactive import InteractiveUI
+    return InteractiveUI()
+
+
+def __getattr__(name):
+    # Keep `studydev.main.interactive_ui` working without an eager import
+    if name == "interactive_ui":
+        return get_interactive_ui()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Main CLI application
 app = typer.Typer(
@@ -29,26 +86,36 @@ app = typer.Typer(
     help="🎯 Ultimate Student & Developer Productivity CLI Tool",
     rich_markup_mode="rich",
     no_args_is_help=True,
+    cls=LazyTyperGroup,
 )
 
-# Add sub-applications
-app.add_typer(session_app, name="session", help="📚 Study & Dev Session Manager")
-app.add_typer(project_app, name="project", help="📝 Academic Project Organizer") 
-app.add_typer(study_app, name="study", help="🔖 Study Material Aggregator")
+
+@app.callback()
+def main_callback(
+    no_animation: bool = typer.Option(False, "--no-animation", help="Skip decorative animations and delays")
+):
+    if no_animation:
+        # Read by InteractiveUI (also honoured by sub-applications)
+        os.environ["STUDYDEV_NO_ANIMATION"] = "1"
 
 
 @app.command()
 def init():
     """🚀 Initialize StudyDev configuration and database"""
     try:
+        from rich.prompt import Confirm
+        from studydev.core.database import get_db
+        
+        interactive_ui = get_interactive_ui()
+        
         # Show beautiful welcome animation
         interactive_ui.show_welcome_animation()
         
         # Initialize system
         interactive_ui.show_loading_animation("Initializing StudyDev system...", 1.5)
         
-        config = Config()
-        db = Database()
+        config = get_config()
+        db = get_db()
         
         console.print("\n🎉 [bold green]StudyDev initialized successfully![/bold green]")
         console.print(f"📍 Config location: {config.config_path}")
@@ -69,16 +136,18 @@ def init():
 def status():
     """📊 Show StudyDev status and statistics"""
     try:
-        config = Config()
-        db = Database()
+        from studydev.core.database import get_db
+        
+        interactive_ui = get_interactive_ui()
+        config = get_config()
+        db = get_db()
         
         # Show loading animation
         interactive_ui.show_loading_animation("Loading your StudyDev dashboard...", 1.0)
         
         # Get comprehensive status data
-        from studydev.utils.integration import IntegrationManager
-        integration = IntegrationManager()
-        dashboard_data = integration.generate_dashboard_data()
+        from studydev.utils.dashboard_cache import get_dashboard_data
+        dashboard_data = get_dashboard_data()
         
         # Calculate productivity metrics
         recent_stats = dashboard_data["recent_stats"]
@@ -95,7 +164,7 @@ def status():
             "streak": dashboard_data.get("current_streak", 0),
             "active_projects": recent_stats.get("active_projects", 0),
             "completed_projects": dashboard_data.get("completed_projects", 0),
-            "due_soon": len([d for d in dashboard_data.get("upcoming_deadlines", []) if d.get("days_left", 0) <= 7]),
+            "due_soon": dashboard_data.get("due_soon", 0),
             "total_flashcards": dashboard_data.get("total_flashcards", 0),
             "flashcards_due": dashboard_data.get("flashcards_due", 0),
             "total_bookmarks": dashboard_data.get("total_bookmarks", 0),
@@ -120,19 +189,49 @@ def status():
         raise typer.Exit(1)
 
 
+def _fsync_file(path: Path):
+    """Flush a written file's data to disk"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Some platforms cannot fsync a read-only descriptor
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: Path):
+    """Persist directory entries (new or renamed files) where the OS supports it"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on some platforms (e.g. Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 @app.command()
 def backup(
     path: str = typer.Option(None, help="Custom backup path"),
-    include_config: bool = typer.Option(True, help="Include configuration in backup")
+    include_config: bool = typer.Option(True, help="Include configuration in backup"),
+    compact: bool = typer.Option(False, help="Write a compacted database copy (VACUUM INTO)"),
+    archive: bool = typer.Option(True, "--zip/--no-zip", help="Package the backup as a single .zip file")
 ):
     """💾 Create a backup of all StudyDev data"""
     try:
-        from datetime import datetime
         import shutil
-        from pathlib import Path
+        from concurrent.futures import ThreadPoolExecutor
+        from studydev.core.database import get_db
         
-        config = Config()
-        db = Database()
+        config = get_config()
+        db = get_db()
         
         # Generate backup filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -141,51 +240,97 @@ def backup(
         if path:
             backup_dir = Path(path).expanduser() / backup_name
         else:
-            backup_dir = Path(config.data_path) / "backups" / backup_name
+            backup_dir = config.backups_dir / backup_name
         
         backup_dir.mkdir(parents=True, exist_ok=True)
         
         console.print(f"\n💾 [bold blue]Creating StudyDev backup...[/bold blue]")
         console.print(f"📁 Backup location: {backup_dir}")
         
-        # Backup database
         db_backup_path = str(backup_dir / "studydev.db")
-        db.backup_database(db_backup_path)
+        templates_dir = Path(config.data_path) / "templates"
         
-        # Backup configuration
-        if include_config:
+        def backup_config():
             config_backup_path = backup_dir / "config.json"
-            if Path(config.config_path).exists():
+            try:
                 shutil.copy2(config.config_path, config_backup_path)
-                console.print("⚙️  [green]Configuration backed up[/green]")
+                return "⚙️  [green]Configuration backed up[/green]"
+            except FileNotFoundError:
+                pass
+            
+            # Save current config to create the file, then backup
+            config.save_config()
+            shutil.copy2(config.config_path, config_backup_path)
+            return "⚙️  [green]Configuration created and backed up[/green]"
+        
+        def backup_templates():
+            shutil.copytree(templates_dir, backup_dir / "templates")
+            return "📋 [green]Templates backed up[/green]"
+        
+        # Configuration and templates are copied in worker threads while the
+        # database is backed up here (on the shared connection)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+            if include_config:
+                futures.append(executor.submit(backup_config))
+            if templates_dir.exists():
+                futures.append(executor.submit(backup_templates))
+            
+            # Backup database
+            if compact:
+                db.backup_database(db_backup_path, compact=True)
             else:
-                # Save current config to create the file, then backup
-                config.save_config()
-                shutil.copy2(config.config_path, config_backup_path)
-                console.print("⚙️  [green]Configuration created and backed up[/green]")
-        
-        # Backup templates
-        templates_dir = Path(config.data_path) / "templates"
-        if templates_dir.exists():
-            backup_templates_dir = backup_dir / "templates"
-            shutil.copytree(templates_dir, backup_templates_dir)
-            console.print("📋 [green]Templates backed up[/green]")
+                from rich.progress import Progress
+                
+                with Progress(console=console, transient=True) as progress:
+                    task = progress.add_task("Backing up database...", total=None)
+                    db.backup_database(
+                        db_backup_path,
+                        progress=lambda copied, total: progress.update(task, completed=copied, total=total)
+                    )
+            
+            for future in futures:
+                console.print(future.result())
         
-        # Create backup manifest
+        # Create backup manifest (one stat of the copied database)
+        db_backup_stat = os.stat(db_backup_path)
         manifest = {
             "created_at": datetime.now().isoformat(),
             "version": "1.0.0",
             "includes_config": include_config,
-            "database_size_mb": round(Path(db_backup_path).stat().st_size / 1024 / 1024, 2)
+            "database_size_mb": round(db_backup_stat.st_size / 1024 / 1024, 2)
         }
         
-        import json
-        with open(backup_dir / "manifest.json", 'w') as f:
-            json.dump(manifest, f, indent=2)
+        (backup_dir / "manifest.json").write_bytes(serialization.dumps(manifest, indent=True))
+        
+        backup_location = backup_dir
+        if archive:
+            # One sequential file is cheaper to move and restore than many small ones
+            import zipfile
+            
+            backup_location = backup_dir.with_suffix(".zip")
+            with open(backup_location, 'wb') as archive_file:
+                with zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                    for file in sorted(backup_dir.rglob("*")):
+                        zf.write(file, file.relative_to(backup_dir))
+                archive_file.flush()
+                os.fsync(archive_file.fileno())
+            shutil.rmtree(backup_dir)
+        else:
+            # Flush only the files this backup wrote, then their directory entries
+            for path in backup_dir.rglob("*"):
+                if path.is_dir():
+                    _fsync_directory(path)
+                else:
+                    _fsync_file(path)
+            _fsync_directory(backup_dir)
+        
+        # Make the new backup's directory entry durable
+        _fsync_directory(backup_location.parent)
         
         console.print(f"\n✅ [bold green]Backup completed successfully![/bold green]")
         console.print(f"📦 Backup size: ~{manifest['database_size_mb']} MB")
-        console.print(f"🎯 Restore with: studydev restore --path {backup_dir}")
+        console.print(f"🎯 Restore with: studydev restore {backup_location}")
         
     except Exception as e:
         console.print(f"\n❌ [bold red]Backup failed:[/bold red] {e}")
@@ -193,62 +338,92 @@ def backup(
 
 @app.command()
 def restore(
-    path: str = typer.Argument(..., help="Path to backup directory"),
+    path: str = typer.Argument(..., help="Path to backup directory or .zip archive"),
     confirm: bool = typer.Option(False, "--yes", help="Skip confirmation prompt")
 ):
     """🔄 Restore StudyDev data from backup"""
+    extracted = None
     try:
-        from pathlib import Path
         import shutil
-        import json
+        from concurrent.futures import ThreadPoolExecutor
+        from studydev.core.database import get_db
+        
+        import stat
         
         backup_dir = Path(path).expanduser()
         
-        if not backup_dir.exists():
+        try:
+            backup_mode = backup_dir.stat().st_mode
+        except FileNotFoundError:
             console.print(f"❌ [red]Backup directory not found: {path}[/red]")
             raise typer.Exit(1)
         
+        # Unpack archived backups into a temporary directory
+        if stat.S_ISREG(backup_mode):
+            import tempfile
+            import zipfile
+            
+            if not zipfile.is_zipfile(backup_dir):
+                console.print(f"❌ [red]Not a StudyDev backup archive: {path}[/red]")
+                raise typer.Exit(1)
+            
+            extracted = tempfile.TemporaryDirectory(prefix="studydev_restore_")
+            with zipfile.ZipFile(backup_dir) as zf:
+                zf.extractall(extracted.name)
+            backup_dir = Path(extracted.name)
+        
+        # List the backup once instead of checking each file separately
+        entries = {entry.name: entry for entry in backup_dir.iterdir()}
+        
         # Check manifest
-        manifest_file = backup_dir / "manifest.json"
-        if manifest_file.exists():
-            with open(manifest_file, 'r') as f:
-                manifest = json.load(f)
+        if "manifest.json" in entries:
+            manifest = serialization.loads(entries["manifest.json"].read_bytes())
             console.print(f"\n📋 [bold]Backup Information:[/bold]")
             console.print(f"📅 Created: {manifest.get('created_at', 'Unknown')}")
             console.print(f"📦 Size: ~{manifest.get('database_size_mb', 0)} MB")
         
         if not confirm:
-            import typer
             if not typer.confirm("\n⚠️  This will replace all current StudyDev data. Continue?"):
                 console.print("❌ [yellow]Restore cancelled[/yellow]")
                 raise typer.Exit(0)
         
-        config = Config()
-        db = Database()
+        config = get_config()
+        db = get_db()
         
         console.print(f"\n🔄 [bold blue]Restoring StudyDev data...[/bold blue]")
         
-        # Restore database
-        db_backup = backup_dir / "studydev.db"
-        if db_backup.exists():
-            db.restore_database(str(db_backup))
-        else:
-            console.print("⚠️  [yellow]No database backup found[/yellow]")
+        config_backup = entries.get("config.json")
+        templates_backup = entries.get("templates")
         
-        # Restore configuration
-        config_backup = backup_dir / "config.json"
-        if config_backup.exists():
+        def restore_config():
             shutil.copy2(config_backup, config.config_path)
-            console.print("⚙️  [green]Configuration restored[/green]")
+            return "⚙️  [green]Configuration restored[/green]"
         
-        # Restore templates
-        templates_backup = backup_dir / "templates"
-        if templates_backup.exists():
+        def restore_templates():
             templates_dir = Path(config.data_path) / "templates"
             if templates_dir.exists():
                 shutil.rmtree(templates_dir)
             shutil.copytree(templates_backup, templates_dir)
-            console.print("📋 [green]Templates restored[/green]")
+            return "📋 [green]Templates restored[/green]"
+        
+        # Configuration and templates are restored in worker threads while the
+        # database is restored here
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+            if config_backup is not None:
+                futures.append(executor.submit(restore_config))
+            if templates_backup is not None:
+                futures.append(executor.submit(restore_templates))
+            
+            # Restore database
+            db_backup = entries.get("studydev.db")
+            if db_backup is not None:
+                db.restore_database(str(db_backup))
+            else:
+                console.print("⚠️  [yellow]No database backup found[/yellow]")
+            
+            for future in futures:
+                console.print(future.result())
         
         console.print(f"\n✅ [bold green]Restore completed successfully![/bold green]")
         console.print("🎯 StudyDev is ready to use with restored data")
@@ -256,16 +431,41 @@ def restore(
     except Exception as e:
         console.print(f"\n❌ [bold red]Restore failed:[/bold red] {e}")
         raise typer.Exit(1)
+    finally:
+        if extracted is not None:
+            extracted.cleanup()
+
+_BOOL_VALUES = {'true': True, 'false': False}
+
+def _parse_config_value(value: str):
+    """Convert a command-line config value to bool, int or float where possible"""
+    lowered = value.lower()
+    if lowered in _BOOL_VALUES:
+        return _BOOL_VALUES[lowered]
+    
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    
+    # Keep words like "nan" or "inf" as strings
+    return number if math.isfinite(number) else value
 
 @app.command()
 def config(
     action: str = typer.Argument(..., help="Action (show/set/reset)"),
     key: str = typer.Option(None, help="Configuration key (dot notation)"),
-    value: str = typer.Option(None, help="Configuration value")
+    value: str = typer.Option(None, help="Configuration value"),
+    kv: Optional[List[str]] = typer.Option(None, "--kv", help="key=value pair to set (repeatable)")
 ):
     """⚙️  Manage StudyDev configuration"""
     try:
-        config_manager = Config()
+        config_manager = get_config()
         
         if action == "show":
             if key:
@@ -278,21 +478,28 @@ def config(
                 config_manager.display_config()
         
         elif action == "set":
-            if not key or value is None:
-                console.print("❌ [red]Both key and value required for set action[/red]")
-                raise typer.Exit(1)
+            updates = {}
+            if key is not None or value is not None:
+                if not key or value is None:
+                    console.print("❌ [red]Both key and value required for set action[/red]")
+                    raise typer.Exit(1)
+                updates[key] = _parse_config_value(value)
+            
+            for pair in kv or []:
+                pair_key, sep, pair_value = pair.partition("=")
+                if not sep or not pair_key:
+                    console.print(f"❌ [red]Expected key=value, got: {pair}[/red]")
+                    raise typer.Exit(1)
+                updates[pair_key] = _parse_config_value(pair_value)
             
-            # Parse value (try to convert to appropriate type)
-            parsed_value = value
-            if value.lower() in ['true', 'false']:
-                parsed_value = value.lower() == 'true'
-            elif value.isdigit():
-                parsed_value = int(value)
-            elif value.replace('.', '').isdigit():
-                parsed_value = float(value)
+            if not updates:
+                console.print("❌ [red]Both key and value (or --kv key=value) required for set action[/red]")
+                raise typer.Exit(1)
             
-            config_manager.set(key, parsed_value)
-            console.print(f"✅ [green]Configuration updated: {key} = {parsed_value}[/green]")
+            # Apply every value and write the file once
+            config_manager.batch_set(updates)
+            for updated_key, parsed_value in updates.items():
+                console.print(f"✅ [green]Configuration updated: {updated_key} = {parsed_value}[/green]")
         
         elif action == "reset":
             if typer.confirm("⚠️  Reset all configuration to defaults?"):
@@ -308,20 +515,71 @@ def config(
         console.print(f"\n❌ [bold red]Configuration error:[/bold red] {e}")
         raise typer.Exit(1)
 
+# Write buffer for export files (1 MiB)
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Export sources per data type (FROM clause, ORDER BY), in output order
+_EXPORT_SOURCES = {
+    "sessions": ("sessions s LEFT JOIN projects p ON s.project_id = p.id", "s.start_time DESC"),
+    "projects": ("projects", "updated_at DESC"),
+    "bookmarks": ("bookmarks", "created_at DESC"),
+    "flashcards": ("flashcards", "created_at DESC"),
+    "courses": ("courses", "updated_at DESC"),
+}
+
+# Columns exported per data type
+_EXPORT_COLUMNS = {
+    "sessions": [
+        "s.id", "s.session_type", "s.project_id", "s.subject", "s.start_time", "s.end_time",
+        "s.duration", "s.productivity_rating", "s.created_at", "p.name AS project_name",
+    ],
+    "projects": [
+        "id", "name", "project_type", "language", "path", "git_repo", "deadline",
+        "status", "priority", "created_at", "updated_at",
+    ],
+    "bookmarks": [
+        "id", "title", "url", "category", "tags", "is_read", "rating", "created_at", "accessed_at",
+    ],
+    "flashcards": [
+        "id", "question", "answer", "subject", "difficulty", "last_reviewed", "next_review",
+        "review_count", "correct_streak", "tags", "created_at",
+    ],
+    "courses": [
+        "id", "title", "platform", "instructor", "url", "total_lessons", "completed_lessons",
+        "progress_percentage", "status", "start_date", "target_completion_date",
+        "created_at", "updated_at",
+    ],
+}
+
+# Free-text columns only exported with --full
+_EXPORT_FULL_COLUMNS = {
+    "sessions": ["s.notes"],
+    "projects": ["description"],
+    "bookmarks": ["description"],
+}
+
+
+def _export_query(data_name: str, full: bool = False) -> str:
+    """Build the export query for a data type"""
+    columns = _EXPORT_COLUMNS[data_name]
+    if full:
+        columns = columns + _EXPORT_FULL_COLUMNS.get(data_name, [])
+    source, order_by = _EXPORT_SOURCES[data_name]
+    return f"SELECT {', '.join(columns)} FROM {source} ORDER BY {order_by}"
+
 @app.command()
 def export(
     format_type: str = typer.Option("json", help="Export format (json/csv)"),
     output: str = typer.Option(None, help="Output file path"),
-    data_type: str = typer.Option("all", help="Data to export (all/sessions/projects/bookmarks/flashcards/courses)")
+    data_type: str = typer.Option("all", help="Data to export (all/sessions/projects/bookmarks/flashcards/courses)"),
+    full: bool = typer.Option(False, "--full", help="Include notes and descriptions")
 ):
     """📤 Export StudyDev data to external formats"""
     try:
-        from datetime import datetime
-        from pathlib import Path
-        import json
         import csv
+        from studydev.core.database import get_db
         
-        db = Database()
+        db = get_db()
         
         # Generate default filename
         if not output:
@@ -333,56 +591,60 @@ def export(
         console.print(f"📄 Format: {format_type.upper()}")
         console.print(f"📁 Output: {output}")
         
-        # Get data based on type
-        export_data = {}
-        
-        if data_type in ["all", "sessions"]:
-            sessions = db.execute_query("""
-                SELECT s.*, p.name as project_name 
-                FROM sessions s 
-                LEFT JOIN projects p ON s.project_id = p.id 
-                ORDER BY s.start_time DESC
-            """)
-            export_data["sessions"] = [dict(session) for session in sessions]
-        
-        if data_type in ["all", "projects"]:
-            projects = db.execute_query("SELECT * FROM projects ORDER BY updated_at DESC")
-            export_data["projects"] = [dict(project) for project in projects]
-        
-        if data_type in ["all", "bookmarks"]:
-            bookmarks = db.execute_query("SELECT * FROM bookmarks ORDER BY created_at DESC")
-            export_data["bookmarks"] = [dict(bookmark) for bookmark in bookmarks]
+        # Select the tables to export
+        export_queries = [
+            (name, _export_query(name, full)) for name in _EXPORT_SOURCES
+            if data_type in ["all", name]
+        ]
         
-        if data_type in ["all", "flashcards"]:
-            flashcards = db.execute_query("SELECT * FROM flashcards ORDER BY created_at DESC")
-            export_data["flashcards"] = [dict(flashcard) for flashcard in flashcards]
+        # Stream rows straight from the database to the output file(s)
+        total_records = 0
         
-        if data_type in ["all", "courses"]:
-            courses = db.execute_query("SELECT * FROM courses ORDER BY updated_at DESC")
-            export_data["courses"] = [dict(course) for course in courses]
-        
-        # Export to specified format
         if format_type == "json":
-            with open(output, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(output, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                f.write(b"{")
+                for table_index, (data_name, query) in enumerate(export_queries):
+                    f.write(b",\n  " if table_index else b"\n  ")
+                    f.write(serialization.dumps(data_name) + b": [")
+                    
+                    row_count = 0
+                    for rows in db.execute_query_batches(query):
+                        f.write(b",\n    " if row_count else b"\n    ")
+                        f.write(b",\n    ".join(serialization.dumps(dict(row), default=str) for row in rows))
+                        row_count += len(rows)
+                    
+                    f.write(b"\n  ]" if row_count else b"]")
+                    total_records += row_count
+                f.write(b"\n}\n")
         
         elif format_type == "csv":
             # For CSV, export each data type to separate files or sheets
             base_name = Path(output).stem
-            for data_name, data_list in export_data.items():
-                if data_list:
-                    csv_file = f"{base_name}_{data_name}.csv"
-                    with open(csv_file, 'w', newline='') as f:
-                        if data_list:
-                            writer = csv.DictWriter(f, fieldnames=data_list[0].keys())
-                            writer.writeheader()
-                            writer.writerows(data_list)
+            for data_name, query in export_queries:
+                csv_file = f"{base_name}_{data_name}.csv"
+                f = None
+                row_count = 0
+                try:
+                    for rows in db.execute_query_batches(query):
+                        if f is None:
+                            # Only create the file once the table has rows
+                            f = open(csv_file, 'w', newline='', buffering=_EXPORT_BUFFER_SIZE)
+                            writer = csv.writer(f)
+                            writer.writerow(rows[0].keys())
+                        # sqlite3.Row is a sequence, so rows are written without dict copies
+                        writer.writerows(rows)
+                        row_count += len(rows)
+                finally:
+                    if f is not None:
+                        f.close()
+                
+                if row_count:
                     console.print(f"📄 [green]Exported {data_name} to {csv_file}[/green]")
+                total_records += row_count
         
         console.print(f"\n✅ [bold green]Export completed successfully![/bold green]")
         
         # Show stats
-        total_records = sum(len(data) for data in export_data.values())
         console.print(f"📊 Total records exported: {total_records}")
         
     except Exception as e:
@@ -393,10 +655,12 @@ def export(
 def dashboard():
     """📋 Show the StudyDev productivity dashboard"""
     try:
-        from studydev.utils.integration import IntegrationManager
+        from rich.text import Text
+        from rich.panel import Panel
+        from rich.table import Table
+        from studydev.utils.dashboard_cache import get_dashboard_data
         
-        integration = IntegrationManager()
-        dashboard_data = integration.generate_dashboard_data()
+        dashboard_data = get_dashboard_data()
         
         console.print("\n🎯 [bold blue]StudyDev Productivity Dashboard[/bold blue]")
         
@@ -432,27 +696,35 @@ def dashboard():
                 
                 console.print(f"  • [{color}]{deadline['name']}: {status}[/{color}]")
         
-        # Recent sessions
-        if dashboard_data["recent_sessions"]:
+        # Recent sessions (the query is already limited; cap defensively for stale caches)
+        recent_sessions = dashboard_data["recent_sessions"][:10]
+        if recent_sessions:
             console.print(f"\n📋 [bold]Recent Sessions[/bold]")
             
-            sessions_table = Table()
-            sessions_table.add_column("Date", style="dim")
-            sessions_table.add_column("Type", style="cyan")
-            sessions_table.add_column("Subject/Project", style="blue")
-            sessions_table.add_column("Duration", justify="right")
-            
-            for session in dashboard_data["recent_sessions"]:
-                subject_or_project = session["subject"] or session["project"] or "N/A"
-                
-                sessions_table.add_row(
+            rows = [
+                (
                     session["date"],
                     session["type"].title(),
-                    subject_or_project,
+                    session["subject"] or session["project"] or "N/A",
                     f"{session['duration_minutes']}m"
                 )
+                for session in recent_sessions
+            ]
             
-            console.print(sessions_table)
+            if console.is_terminal:
+                sessions_table = Table()
+                sessions_table.add_column("Date", style="dim")
+                sessions_table.add_column("Type", style="cyan")
+                sessions_table.add_column("Subject/Project", style="blue")
+                sessions_table.add_column("Duration", justify="right")
+                
+                for row in rows:
+                    sessions_table.add_row(*row)
+                
+                console.print(sessions_table)
+            else:
+                # Piped output: skip table layout and styling
+                console.print("\n".join("  ".join(row) for row in rows), markup=False, highlight=False)
         
         # Quick actions
         console.print(f"\n🚀 [bold]Quick Actions:[/bold]")
@@ -474,7 +746,7 @@ def report(
     """📈 Generate comprehensive productivity report"""
     try:
         from studydev.utils.integration import IntegrationManager
-        import json
+        import heapq
         
         integration = IntegrationManager()
         report_data = integration.generate_productivity_report(days)
@@ -497,8 +769,8 @@ def report(
         # Top subjects
         if sessions["subject_breakdown"]:
             console.print(f"\n📚 [bold]Top Study Subjects[/bold]")
-            subjects = sorted(sessions["subject_breakdown"].items(), 
-                            key=lambda x: x[1]["duration_hours"], reverse=True)[:5]
+            subjects = heapq.nlargest(5, sessions["subject_breakdown"].items(),
+                                      key=lambda x: x[1]["duration_hours"])
             
             for subject, data in subjects:
                 console.print(f"  • {subject}: {data['duration_hours']}h ({data['sessions']} sessions)")
@@ -526,8 +798,8 @@ def report(
             # Most effective subjects
             effectiveness = integration_data["subject_effectiveness"]
             if effectiveness:
-                top_effective = sorted(effectiveness.items(), 
-                                     key=lambda x: x[1]["effectiveness"], reverse=True)[:3]
+                top_effective = heapq.nlargest(3, effectiveness.items(),
+                                               key=lambda x: x[1]["effectiveness"])
                 
                 console.print(f"\n🎯 [bold]Most Effective Study Subjects[/bold]")
                 for subject, data in top_effective:
@@ -535,8 +807,7 @@ def report(
         
         # Save to file if requested
         if output:
-            with open(output, 'w') as f:
-                json.dump(report_data, f, indent=2, default=str)
+            Path(output).write_bytes(serialization.dumps(report_data, indent=True, default=str))
             console.print(f"\n💾 [green]Report saved to: {output}[/green]")
         
     except Exception as e:
@@ -551,81 +822,124 @@ def version():
     console.print("Made with ❤️  by PrinceTheProgrammer\n")
 
 
+# Command overview shown by the quick start guide
+_QUICKSTART_COMMANDS = {
+    "Session Management 📚": {
+        "session start": "Start a Pomodoro study session with timer",
+        "session pause": "Pause current session",
+        "session stop": "Stop and rate current session",
+        "session stats": "View session statistics and streaks",
+        "session history": "Show detailed session history"
+    },
+    "Project Organization 📋": {
+        "project create <name>": "Create new project from template",
+        "project list": "List all projects with progress",
+        "project template list": "Show available project templates",
+        "project update <id>": "Update project status or deadline"
+    },
+    "Study Materials 📖": {
+        "study bookmark add <url>": "Add bookmark with automatic metadata",
+        "study flashcard add": "Create new flashcard for study",
+        "study flashcard review": "Review due flashcards with spaced repetition",
+        "study course add <name>": "Track progress in online courses",
+        "study review": "Show summary of due materials"
+    },
+    "Dashboard & Reports 📈": {
+        "status": "Beautiful productivity dashboard",
+        "dashboard": "Show current productivity metrics",
+        "report": "Generate comprehensive productivity report"
+    },
+    "Data Management 💾": {
+        "backup": "Create backup of all StudyDev data",
+        "restore <path>": "Restore from backup",
+        "export": "Export data to JSON/CSV formats",
+        "config show": "Display current configuration"
+    }
+}
+
+# Interactive menu for first steps
+_FIRST_STEPS = [
+    {
+        "label": "Start a Study Session",
+        "value": "session_start",
+        "icon": "🎯",
+        "description": "Begin your first Pomodoro session"
+    },
+    {
+        "label": "Create a Project",
+        "value": "project_create",
+        "icon": "📁",
+        "description": "Set up a new academic or development project"
+    },
+    {
+        "label": "Add Study Material",
+        "value": "bookmark_add",
+        "icon": "🔖",
+        "description": "Save your first bookmark or flashcard"
+    },
+    {
+        "label": "View Dashboard",
+        "value": "dashboard",
+        "icon": "📈",
+        "description": "See your productivity overview"
+    },
+    {
+        "label": "I'll explore myself",
+        "value": "exit",
+        "icon": "🚀",
+        "description": "Ready to dive in independently"
+    }
+]
+
+# Command reference shown by `studydev help`
+_HELP_COMMANDS = {
+    "Session Management 📚": {
+        "session start [--subject TEXT] [--project-id INT]": "Start focused Pomodoro study session",
+        "session pause": "Pause current active session",
+        "session resume": "Resume paused session", 
+        "session stop [--rating INT]": "Stop session and provide rating",
+        "session stats [--days INT]": "Show session statistics and analytics",
+        "session history [--limit INT]": "Display detailed session history"
+    },
+    "Project Organization 📋": {
+        "project create <name> [--template TEXT] [--description TEXT]": "Create new project from template",
+        "project list [--status TEXT] [--sort TEXT]": "List projects with filtering/sorting",
+        "project show <id>": "Show detailed project information",
+        "project update <id> [--status] [--deadline]": "Update project details",
+        "project template list": "Show available project templates",
+        "project template create <name>": "Create custom project template"
+    },
+    "Study Materials 📖": {
+        "study bookmark add <url> [--title] [--tags] [--subject]": "Add bookmark with metadata",
+        "study bookmark list [--subject] [--unread]": "List bookmarks with filters",
+        "study flashcard add [--subject]": "Create new flashcard interactively",
+        "study flashcard review [--subject] [--limit]": "Review flashcards with spaced repetition",
+        "study course add <name> [--url] [--total-lessons]": "Track online course progress",
+        "study review [--subject] [--limit]": "Show comprehensive study review"
+    },
+    "Analytics & Reports 📈": {
+        "status": "Beautiful productivity dashboard with metrics",
+        "dashboard": "Real-time productivity overview", 
+        "report [--days INT] [--output FILE]": "Generate detailed productivity report"
+    },
+    "Data Management 💾": {
+        "init": "Initialize StudyDev with welcome guide",
+        "backup [--path TEXT] [--include-config]": "Create comprehensive backup",
+        "restore <path> [--yes]": "Restore from backup directory",
+        "export [--format] [--data-type] [--output]": "Export data in JSON/CSV formats",
+        "config show|set|reset [--key] [--value]": "Manage configuration settings"
+    }
+}
+
+
 def show_quick_start_guide():
     """Display an interactive quick start guide"""
-    commands_help = {
-        "Session Management 📚": {
-            "session start": "Start a Pomodoro study session with timer",
-            "session pause": "Pause current session",
-            "session stop": "Stop and rate current session",
-            "session stats": "View session statistics and streaks",
-            "session history": "Show detailed session history"
-        },
-        "Project Organization 📋": {
-            "project create <name>": "Create new project from template",
-            "project list": "List all projects with progress",
-            "project template list": "Show available project templates",
-            "project update <id>": "Update project status or deadline"
-        },
-        "Study Materials 📖": {
-            "study bookmark add <url>": "Add bookmark with automatic metadata",
-            "study flashcard add": "Create new flashcard for study",
-            "study flashcard review": "Review due flashcards with spaced repetition",
-            "study course add <name>": "Track progress in online courses",
-            "study review": "Show summary of due materials"
-        },
-        "Dashboard & Reports 📈": {
-            "status": "Beautiful productivity dashboard",
-            "dashboard": "Show current productivity metrics",
-            "report": "Generate comprehensive productivity report"
-        },
-        "Data Management 💾": {
-            "backup": "Create backup of all StudyDev data",
-            "restore <path>": "Restore from backup",
-            "export": "Export data to JSON/CSV formats",
-            "config show": "Display current configuration"
-        }
-    }
-    
-    interactive_ui.create_help_display(commands_help)
-    
-    # Interactive menu for first steps
-    first_steps = [
-        {
-            "label": "Start a Study Session",
-            "value": "session_start",
-            "icon": "🎯",
-            "description": "Begin your first Pomodoro session"
-        },
-        {
-            "label": "Create a Project",
-            "value": "project_create",
-            "icon": "📁",
-            "description": "Set up a new academic or development project"
-        },
-        {
-            "label": "Add Study Material",
-            "value": "bookmark_add",
-            "icon": "🔖",
-            "description": "Save your first bookmark or flashcard"
-        },
-        {
-            "label": "View Dashboard",
-            "value": "dashboard",
-            "icon": "📈",
-            "description": "See your productivity overview"
-        },
-        {
-            "label": "I'll explore myself",
-            "value": "exit",
-            "icon": "🚀",
-            "description": "Ready to dive in independently"
-        }
-    ]
+    interactive_ui = get_interactive_ui()
+    interactive_ui.create_help_display(_QUICKSTART_COMMANDS)
     
     choice = interactive_ui.create_interactive_menu(
         "🎆 What would you like to do first?",
-        first_steps,
+        _FIRST_STEPS,
         "green"
     )
     
@@ -648,46 +962,8 @@ def quickstart():
 @app.command() 
 def help():
     """📚 Show comprehensive help with beautiful formatting"""
-    commands_help = {
-        "Session Management 📚": {
-            "session start [--subject TEXT] [--project-id INT]": "Start focused Pomodoro study session",
-            "session pause": "Pause current active session",
-            "session resume": "Resume paused session", 
-            "session stop [--rating INT]": "Stop session and provide rating",
-            "session stats [--days INT]": "Show session statistics and analytics",
-            "session history [--limit INT]": "Display detailed session history"
-        },
-        "Project Organization 📋": {
-            "project create <name> [--template TEXT] [--description TEXT]": "Create new project from template",
-            "project list [--status TEXT] [--sort TEXT]": "List projects with filtering/sorting",
-            "project show <id>": "Show detailed project information",
-            "project update <id> [--status] [--deadline]": "Update project details",
-            "project template list": "Show available project templates",
-            "project template create <name>": "Create custom project template"
-        },
-        "Study Materials 📖": {
-            "study bookmark add <url> [--title] [--tags] [--subject]": "Add bookmark with metadata",
-            "study bookmark list [--subject] [--unread]": "List bookmarks with filters",
-            "study flashcard add [--subject]": "Create new flashcard interactively",
-            "study flashcard review [--subject] [--limit]": "Review flashcards with spaced repetition",
-            "study course add <name> [--url] [--total-lessons]": "Track online course progress",
-            "study review [--subject] [--limit]": "Show comprehensive study review"
-        },
-        "Analytics & Reports 📈": {
-            "status": "Beautiful productivity dashboard with metrics",
-            "dashboard": "Real-time productivity overview", 
-            "report [--days INT] [--output FILE]": "Generate detailed productivity report"
-        },
-        "Data Management 💾": {
-            "init": "Initialize StudyDev with welcome guide",
-            "backup [--path TEXT] [--include-config]": "Create comprehensive backup",
-            "restore <path> [--yes]": "Restore from backup directory",
-            "export [--format] [--data-type] [--output]": "Export data in JSON/CSV formats",
-            "config show|set|reset [--key] [--value]": "Manage configuration settings"
-        }
-    }
-    
-    interactive_ui.create_help_display(commands_help)
+    interactive_ui = get_interactive_ui()
+    interactive_ui.create_help_display(_HELP_COMMANDS)
     
     console.print(f"\n🎆 [bold green]Pro Tips:[/bold green]")
     console.print("• Start with [cyan]studydev init[/cyan] for first-time setup")
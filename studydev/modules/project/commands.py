@@ -3,17 +3,113 @@ StudyDev Project Management Commands
 Handles academic projects, assignments, deadlines, and project templates
 """
 
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich.prompt import Prompt
 
-from studydev.modules.project.manager import ProjectManager
+from studydev.core import serialization
+from studydev.utils.dashboard_cache import invalidate_dashboard_cache
 
 console = Console()
 
+# Shape check for YYYY-MM-DD before the stricter strptime validation
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Above this many rows tables are printed as plain aligned text
+_PLAIN_TABLE_THRESHOLD = 200
+
+# From this many rows project lists are streamed with fixed column widths
+_STREAM_ROWS_THRESHOLD = 50
+
+# (header, width, style) for streamed project lists; widths follow the schema, not the data
+_PROJECT_LIST_COLUMNS = (
+    ("ID", 4, "dim"),
+    ("Name", 30, "bold blue"),
+    ("Type", 10, "magenta"),
+    ("Language", 12, "cyan"),
+    ("Status", 12, ""),
+    ("Priority", 10, ""),
+    ("Deadline", 24, "yellow"),
+    ("Path", 40, "green"),
+)
+
+# Star ratings indexed by priority (1-5)
+_PRIORITY_STARS = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+_VALID_STATUSES = frozenset({"active", "completed", "paused", "cancelled"})
+
+_STATUS_ICONS = {
+    "active": "✅",
+    "completed": "✔️",
+    "paused": "⏸️",
+    "cancelled": "❌"
+}
+
+# Urgency -> (label, color); labels become Text cells so no markup is parsed per row
+_URGENCY_STYLES = {
+    "overdue": ("🔥 OVERDUE", "red"),
+    "urgent": ("⚠️ URGENT", "red"),
+    "soon": ("⏰ SOON", "yellow"),
+    "upcoming": ("📅 UPCOMING", "green")
+}
+
+
+def _print_json(data):
+    """Write data as JSON straight to stdout, bypassing rich"""
+    sys.stdout.buffer.write(serialization.dumps(data, indent=True) + b"\n")
+    sys.stdout.buffer.flush()
+
+def _print_plain_rows(headers, rows):
+    """Print rows as left-aligned plain text columns"""
+    from rich.cells import cell_len
+    
+    rows = [[str(cell) for cell in row] for row in (headers, *rows)]
+    widths = [max(cell_len(row[i]) for row in rows) for i in range(len(headers))]
+    lines = [
+        "  ".join(cell + " " * (width - cell_len(cell)) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    ]
+    console.print("\n".join(lines), markup=False, highlight=False, soft_wrap=True)
+
+@lru_cache(maxsize=1)
+def _get_manager():
+    """Shared ProjectManager for all project commands"""
+    from studydev.modules.project.manager import ProjectManager
+    return ProjectManager()
+
+def _print_project_rows(rows, chunk_size: int = 100):
+    """Stream project rows with fixed column widths, printing one chunk at a time"""
+    from rich.text import Text
+    
+    separator = Text(" ")
+    
+    def fit(cell, width, style):
+        text = cell.copy() if isinstance(cell, Text) else Text(cell, style=style)
+        text.truncate(width, overflow="ellipsis", pad=True)
+        return text
+    
+    def line(cells):
+        text = separator.join(cells)
+        text.rstrip()
+        return text
+    
+    console.print(
+        line(Text(name.ljust(width), style="bold") for name, width, _ in _PROJECT_LIST_COLUMNS),
+        soft_wrap=True
+    )
+    
+    for start in range(0, len(rows), chunk_size):
+        lines = [
+            line(fit(cell, width, style) for cell, (_, width, style) in zip(row, _PROJECT_LIST_COLUMNS))
+            for row in rows[start:start + chunk_size]
+        ]
+        console.print(Text("\n").join(lines), soft_wrap=True)
+
 # Create the project sub-application
 project_app = typer.Typer(
     help="📝 Academic Project Organizer - Manage assignments, deadlines, and project templates",
@@ -31,14 +127,13 @@ def create_project(
     path: str = typer.Option(None, help="Custom project path")
 ):
     """🚀 Create a new project with optional template"""
-    manager = ProjectManager()
+    manager = _get_manager()
     
     console.print(f"\n📝 Creating new {project_type} project: {name}")
     
     # Show available templates if language is specified but template is not
     if language and not template:
-        available_templates = manager.get_project_templates()
-        if language in available_templates:
+        if (manager.templates_dir / f"{language}.json").is_file():
             template = language
             console.print(f"📋 Using {language} template")
     
@@ -54,20 +149,24 @@ def create_project(
     )
     
     if result["success"]:
-        console.print(f"\n✅ [green]{result['message']}[/green]")
-        console.print(f"📁 Path: {result['path']}")
-        console.print(f"🆔 Project ID: {result['project_id']}")
+        lines = [
+            f"\n✅ [green]{result['message']}[/green]",
+            f"📁 Path: {result['path']}",
+            f"🆔 Project ID: {result['project_id']}",
+        ]
         
         if template:
-            console.print(f"\n📊 [cyan]Template applied! Your project is ready to use.[/cyan]")
+            lines.append(f"\n📊 [cyan]Template applied! Your project is ready to use.[/cyan]")
         
-        console.print("\n🚀 [bold]Next steps:[/bold]")
-        console.print(f"  • cd {result['path']}")
+        lines.append("\n🚀 [bold]Next steps:[/bold]")
+        lines.append(f"  • cd {result['path']}")
         if template == "python":
-            console.print("  • python main.py")
+            lines.append("  • python main.py")
         elif template == "javascript":
-            console.print("  • npm start")
-        console.print("  • studydev session start --project \"" + name + "\"")
+            lines.append("  • npm start")
+        lines.append("  • studydev session start --project \"" + name + "\"")
+        
+        console.print("\n".join(lines))
     else:
         console.print(f"\n❌ [red]{result['message']}[/red]")
 
@@ -75,43 +174,41 @@ def create_project(
 def list_projects(
     status: str = typer.Option("all", help="Filter by status (active/completed/paused/all)"),
     project_type: str = typer.Option("all", help="Filter by type (academic/personal/work/all)"),
-    sort_by: str = typer.Option("updated_at", help="Sort by field (name/deadline/priority/created_at/updated_at)")
+    sort_by: str = typer.Option("updated_at", help="Sort by field (name/deadline/priority/created_at/updated_at)"),
+    limit: int = typer.Option(50, help="Maximum number of projects to show"),
+    offset: int = typer.Option(0, help="Number of projects to skip"),
+    output_format: str = typer.Option("table", "--format", help="Output format (table/json)")
 ):
     """📋 List all projects with status and details"""
-    manager = ProjectManager()
-    projects = manager.list_projects(status=status, project_type=project_type, sort_by=sort_by)
+    from rich.table import Table
+    from rich.text import Text
+    
+    manager = _get_manager()
+    projects = manager.list_projects(
+        status=status, project_type=project_type, sort_by=sort_by, limit=limit, offset=offset
+    )
+    
+    if output_format == "json":
+        _print_json(projects)
+        return
     
     if not projects:
         console.print(f"\n📋 [yellow]No projects found matching criteria.[/yellow]")
         console.print("Create your first project with: [cyan]studydev project new \"My Project\"[/cyan]")
         return
     
-    console.print(f"\n📋 [bold]Projects ({len(projects)} found)[/bold]")
-    console.print(f"[dim]Filtered by: Status={status}, Type={project_type}, Sorted by={sort_by}[/dim]")
+    # Only count when the page might not hold every match
+    total = len(projects) + offset
+    if offset or len(projects) == limit:
+        total = manager.count_projects(status=status, project_type=project_type)
     
-    # Create projects table
-    projects_table = Table()
-    projects_table.add_column("ID", style="dim", width=4)
-    projects_table.add_column("Name", style="bold blue")
-    projects_table.add_column("Type", style="magenta")
-    projects_table.add_column("Language", style="cyan")
-    projects_table.add_column("Status", justify="center")
-    projects_table.add_column("Priority", justify="center")
-    projects_table.add_column("Deadline", style="yellow")
-    projects_table.add_column("Path", style="green")
+    console.print(f"\n📋 [bold]Projects ({total} found)[/bold]")
+    console.print(f"[dim]Filtered by: Status={status}, Type={project_type}, Sorted by={sort_by}[/dim]")
     
+    # Build the rows once; styled cells are Text objects so no markup is parsed
+    rows = []
     for project in projects:
-        # Status icon
-        status_icons = {
-            "active": "✅",
-            "completed": "✔️",
-            "paused": "⏸️", 
-            "cancelled": "❌"
-        }
-        status_display = f"{status_icons.get(project['status'], project['status'])} {project['status']}"
-        
-        # Priority stars
-        priority_stars = "⭐" * project['priority']
+        status_display = f"{_STATUS_ICONS.get(project['status'], project['status'])} {project['status']}"
         
         # Deadline formatting
         deadline_display = "N/A"
@@ -119,55 +216,75 @@ def list_projects(
             days_left = project['days_until_deadline']
             if days_left is not None:
                 if days_left < 0:
-                    deadline_display = f"[red]{project['deadline']} (OVERDUE)[/red]"
+                    deadline_display = Text(f"{project['deadline']} (OVERDUE)", style="red")
                 elif days_left <= 3:
-                    deadline_display = f"[yellow]{project['deadline']} ({days_left}d left)[/yellow]"
+                    deadline_display = Text(f"{project['deadline']} ({days_left}d left)", style="yellow")
                 else:
                     deadline_display = f"{project['deadline']} ({days_left}d left)"
             else:
                 deadline_display = project['deadline']
         
-        # Truncate path for display
-        path_display = project['path'][-40:] if len(project['path']) > 40 else project['path']
-        
-        projects_table.add_row(
+        rows.append((
             str(project['id']),
             project['name'],
             project['type'].title(),
             project['language'] or "N/A",
             status_display,
-            priority_stars,
+            _PRIORITY_STARS[project['priority']],
             deadline_display,
-            path_display
-        )
+            project['path_display']
+        ))
+    
+    if len(rows) >= _STREAM_ROWS_THRESHOLD:
+        _print_project_rows(rows)
+    else:
+        projects_table = Table()
+        projects_table.add_column("ID", style="dim", width=4)
+        projects_table.add_column("Name", style="bold blue")
+        projects_table.add_column("Type", style="magenta")
+        projects_table.add_column("Language", style="cyan")
+        projects_table.add_column("Status", justify="center")
+        projects_table.add_column("Priority", justify="center")
+        projects_table.add_column("Deadline", style="yellow")
+        projects_table.add_column("Path", style="green")
+        
+        for row in rows:
+            projects_table.add_row(*row)
+        
+        console.print(projects_table)
     
-    console.print(projects_table)
+    if total > len(projects):
+        console.print(f"[dim]Showing {offset + 1}-{offset + len(projects)} of {total}.[/dim]")
+        if offset + len(projects) < total:
+            console.print(f"[dim]Use --offset {offset + len(projects)} for the next page.[/dim]")
     
     # Show upcoming deadlines if any
     deadlines = manager.get_upcoming_deadlines()
     if deadlines:
-        console.print(f"\n⏰ [bold red]Upcoming Deadlines ({len(deadlines)})[/bold red]")
+        lines = [f"\n⏰ [bold red]Upcoming Deadlines ({len(deadlines)})[/bold red]"]
         for deadline in deadlines[:3]:  # Show top 3
-            urgency_colors = {
-                "overdue": "red",
-                "urgent": "red",
-                "soon": "yellow",
-                "upcoming": "green"
-            }
-            color = urgency_colors.get(deadline['urgency'], "white")
-            console.print(f"  • [{color}]{deadline['name']}: {deadline['deadline']} ({deadline['days_left']}d left)[/{color}]")
+            _, color = _URGENCY_STYLES.get(deadline['urgency'], (None, "white"))
+            lines.append(f"  • [{color}]{deadline['name']}: {deadline['deadline']} ({deadline['days_left']}d left)[/{color}]")
+        console.print("\n".join(lines))
 
 @project_app.command("deadline")
 def manage_deadlines(
     action: str = typer.Argument(..., help="Action (list/upcoming)"),
-    days: int = typer.Option(7, help="Number of days to look ahead (for upcoming)")
+    days: int = typer.Option(7, help="Number of days to look ahead (for upcoming)"),
+    output_format: str = typer.Option("table", "--format", help="Output format (table/json)")
 ):
     """⏰ Manage project deadlines and get reminders"""
-    manager = ProjectManager()
+    from rich.table import Table
+    from rich.text import Text
+    
+    manager = _get_manager()
     
     if action == "list":
-        projects = manager.list_projects()
-        projects_with_deadlines = [p for p in projects if p['deadline']]
+        projects_with_deadlines = manager.list_projects(has_deadline=True, sort_by="deadline", ascending=True)
+        
+        if output_format == "json":
+            _print_json(projects_with_deadlines)
+            return
         
         if not projects_with_deadlines:
             console.print("\n⏰ [yellow]No projects with deadlines found.[/yellow]")
@@ -175,16 +292,7 @@ def manage_deadlines(
         
         console.print(f"\n⏰ [bold]Project Deadlines ({len(projects_with_deadlines)})[/bold]")
         
-        deadline_table = Table()
-        deadline_table.add_column("Project", style="bold blue")
-        deadline_table.add_column("Deadline", style="yellow")
-        deadline_table.add_column("Days Left", justify="right")
-        deadline_table.add_column("Status", justify="center")
-        deadline_table.add_column("Priority", justify="center")
-        
-        # Sort by deadline
-        projects_with_deadlines.sort(key=lambda x: x['deadline'])
-        
+        rows = []
         for project in projects_with_deadlines:
             days_left = project['days_until_deadline']
             
@@ -192,39 +300,44 @@ def manage_deadlines(
             if days_left is None:
                 days_display = "N/A"
             elif days_left < 0:
-                days_display = f"[red]{abs(days_left)} overdue[/red]"
+                days_display = Text(f"{abs(days_left)} overdue", style="red")
             elif days_left == 0:
-                days_display = "[red]TODAY![/red]"
+                days_display = Text("TODAY!", style="red")
             elif days_left <= 3:
-                days_display = f"[yellow]{days_left}[/yellow]"
+                days_display = Text(str(days_left), style="yellow")
             else:
                 days_display = str(days_left)
             
-            # Status icons
-            status_icons = {
-                "active": "✅",
-                "completed": "✔️",
-                "paused": "⏸️",
-                "cancelled": "❌"
-            }
-            status_display = status_icons.get(project['status'], project['status'])
-            
-            # Priority stars
-            priority_stars = "⭐" * project['priority']
-            
-            deadline_table.add_row(
+            rows.append((
                 project['name'],
                 project['deadline'],
                 days_display,
-                status_display,
-                priority_stars
-            )
+                _STATUS_ICONS.get(project['status'], project['status']),
+                _PRIORITY_STARS[project['priority']]
+            ))
         
-        console.print(deadline_table)
+        if len(rows) > _PLAIN_TABLE_THRESHOLD:
+            _print_plain_rows(("Project", "Deadline", "Days Left", "Status", "Priority"), rows)
+        else:
+            deadline_table = Table()
+            deadline_table.add_column("Project", style="bold blue")
+            deadline_table.add_column("Deadline", style="yellow")
+            deadline_table.add_column("Days Left", justify="right")
+            deadline_table.add_column("Status", justify="center")
+            deadline_table.add_column("Priority", justify="center")
+            
+            for row in rows:
+                deadline_table.add_row(*row)
+            
+            console.print(deadline_table)
     
     elif action == "upcoming":
         deadlines = manager.get_upcoming_deadlines(days)
         
+        if output_format == "json":
+            _print_json(deadlines)
+            return
+        
         if not deadlines:
             console.print(f"\n⏰ [green]No upcoming deadlines in the next {days} days![/green]")
             return
@@ -239,37 +352,35 @@ def manage_deadlines(
         upcoming_table.add_column("Priority", justify="center")
         
         for deadline in deadlines:
-            # Urgency icons and colors
-            urgency_display = {
-                "overdue": "[red]🔥 OVERDUE[/red]",
-                "urgent": "[red]⚠️ URGENT[/red]",
-                "soon": "[yellow]⏰ SOON[/yellow]",
-                "upcoming": "[green]📅 UPCOMING[/green]"
-            }
-            
             days_display = str(deadline['days_left']) if deadline['days_left'] >= 0 else f"{abs(deadline['days_left'])} overdue"
-            priority_stars = "⭐" * deadline['priority']
+            priority_stars = _PRIORITY_STARS[deadline['priority']]
+            urgency_label, urgency_color = _URGENCY_STYLES.get(deadline['urgency'], (deadline['urgency'], ""))
             
             upcoming_table.add_row(
                 deadline['name'],
                 deadline['deadline'],
                 days_display,
-                urgency_display.get(deadline['urgency'], deadline['urgency']),
+                Text(urgency_label, style=urgency_color),
                 priority_stars
             )
         
         console.print(upcoming_table)
         
         # Show actionable suggestions
-        overdue_count = sum(1 for d in deadlines if d['urgency'] == 'overdue')
-        urgent_count = sum(1 for d in deadlines if d['urgency'] == 'urgent')
+        urgency_counts = Counter(d['urgency'] for d in deadlines)
+        overdue_count = urgency_counts['overdue']
+        urgent_count = urgency_counts['urgent']
         
         if overdue_count > 0:
-            console.print(f"\n🔥 [bold red]You have {overdue_count} overdue projects![/bold red]")
-            console.print("[red]Consider updating project status or extending deadlines.[/red]")
+            console.print(
+                f"\n🔥 [bold red]You have {overdue_count} overdue projects![/bold red]\n"
+                "[red]Consider updating project status or extending deadlines.[/red]"
+            )
         elif urgent_count > 0:
-            console.print(f"\n⚠️ [yellow]You have {urgent_count} urgent projects to focus on![/yellow]")
-            console.print("[yellow]Start a session: studydev session start --project \"Project Name\"[/yellow]")
+            console.print(
+                f"\n⚠️ [yellow]You have {urgent_count} urgent projects to focus on![/yellow]\n"
+                "[yellow]Start a session: studydev session start --project \"Project Name\"[/yellow]"
+            )
     
     else:
         console.print(f"❌ [red]Unknown action: {action}. Use 'list' or 'upcoming'[/red]")
@@ -284,17 +395,18 @@ def update_project(
     description: str = typer.Option(None, help="New project description")
 ):
     """✏️ Update project details (status, deadline, priority, etc.)"""
-    manager = ProjectManager()
+    manager = _get_manager()
     
     # Check if project exists
-    projects = manager.list_projects()
-    project = next((p for p in projects if p['id'] == project_id), None)
+    project = manager.get_project(project_id)
     
     if not project:
-        console.print(f"❌ [red]Project with ID {project_id} not found[/red]")
-        console.print("\n📋 Available projects:")
-        for p in projects[:5]:  # Show first 5 projects
-            console.print(f"  • ID {p['id']}: {p['name']} ({p['status']})")
+        lines = [f"❌ [red]Project with ID {project_id} not found[/red]", "\n📋 Available projects:"]
+        lines.extend(
+            f"  • ID {p['id']}: {p['name']} ({p['status']})"
+            for p in manager.list_projects(limit=5)  # Show first 5 projects
+        )
+        console.print("\n".join(lines))
         return
     
     console.print(f"\n✏️ Updating project: [bold blue]{project['name']}[/bold blue] (ID: {project_id})")
@@ -304,7 +416,7 @@ def update_project(
     update_messages = []
     
     if status:
-        if status not in ['active', 'completed', 'paused', 'cancelled']:
+        if status not in _VALID_STATUSES:
             console.print("❌ [red]Invalid status. Use: active/completed/paused/cancelled[/red]")
             return
         updates['status'] = status
@@ -313,7 +425,8 @@ def update_project(
     if deadline:
         # Validate date format
         try:
-            from datetime import datetime
+            if not _DATE_RE.match(deadline):
+                raise ValueError(deadline)
             datetime.strptime(deadline, '%Y-%m-%d')
             updates['deadline'] = deadline
             update_messages.append(f"Deadline: {project.get('deadline', 'None')} → [yellow]{deadline}[/yellow]")
@@ -326,7 +439,7 @@ def update_project(
             console.print("❌ [red]Priority must be between 1 and 5[/red]")
             return
         updates['priority'] = priority
-        update_messages.append(f"Priority: {'⭐' * project['priority']} → [yellow]{'⭐' * priority}[/yellow]")
+        update_messages.append(f"Priority: {_PRIORITY_STARS[project['priority']]} → [yellow]{_PRIORITY_STARS[priority]}[/yellow]")
     
     if name:
         updates['name'] = name
@@ -344,30 +457,37 @@ def update_project(
     result = manager.update_project(project_id, **updates)
     
     if result['success']:
-        console.print(f"\n✅ [green]{result['message']}[/green]")
-        
+        invalidate_dashboard_cache()
         # Show what changed
-        console.print("\n📊 [bold]Changes made:[/bold]")
-        for msg in update_messages:
-            console.print(f"  • {msg}")
+        lines = [f"\n✅ [green]{result['message']}[/green]", "\n📊 [bold]Changes made:[/bold]"]
+        lines.extend(f"  • {msg}" for msg in update_messages)
         
         # Show celebration for completion
         if status == 'completed':
-            console.print("\n🎉 [bold green]Congratulations on completing your project![/bold green]")
-            console.print("🏆 [cyan]Another step towards your goals! Keep up the great work![/cyan]")
+            lines.append("\n🎉 [bold green]Congratulations on completing your project![/bold green]")
+            lines.append("🏆 [cyan]Another step towards your goals! Keep up the great work![/cyan]")
+        
+        console.print("\n".join(lines))
     else:
         console.print(f"\n❌ [red]{result['message']}[/red]")
 
 @project_app.command("template")
 def manage_templates(
     action: str = typer.Argument(..., help="Action (list/show)"),
-    name: str = typer.Option(None, help="Template name to show details")
+    name: str = typer.Option(None, help="Template name to show details"),
+    output_format: str = typer.Option("table", "--format", help="Output format (table/json)")
 ):
     """📋 Manage project templates for different languages"""
-    manager = ProjectManager()
+    from rich.table import Table
+    
+    manager = _get_manager()
     
     if action == "list":
-        templates = manager.get_project_templates()
+        templates = manager.get_templates_meta()
+        
+        if output_format == "json":
+            _print_json(templates)
+            return
         
         if not templates:
             console.print("\n📋 [yellow]No templates found.[/yellow]")
@@ -380,28 +500,12 @@ def manage_templates(
         template_table.add_column("Language", style="green")
         template_table.add_column("Description", style="dim")
         
-        for template_name in templates:
-            # Try to load template details
-            template_file = manager.templates_dir / f"{template_name}.json"
-            if template_file.exists():
-                try:
-                    import json
-                    with open(template_file, 'r') as f:
-                        template_data = json.load(f)
-                    
-                    template_table.add_row(
-                        template_name,
-                        template_data.get("language", "N/A"),
-                        template_data.get("description", "No description")
-                    )
-                except:
-                    template_table.add_row(
-                        template_name,
-                        "Unknown",
-                        "Template file corrupted"
-                    )
-            else:
+        # Metadata comes from the template index; only changed files are re-parsed
+        for template_name, meta in templates.items():
+            if meta is None:
                 template_table.add_row(template_name, "Unknown", "Template not found")
+            else:
+                template_table.add_row(template_name, meta["language"], meta["description"])
         
         console.print(template_table)
         console.print("\n🚀 [cyan]Use a template with: studydev project new \"My Project\" --template <name>[/cyan]")
@@ -421,15 +525,18 @@ def manage_templates(
             with open(template_file, 'r') as f:
                 template_data = json.load(f)
             
-            console.print(f"\n📋 [bold]Template: {name}[/bold]")
-            console.print(f"Language: {template_data.get('language', 'N/A')}")
-            console.print(f"Description: {template_data.get('description', 'N/A')}")
+            lines = [
+                f"\n📋 [bold]Template: {name}[/bold]",
+                f"Language: {template_data.get('language', 'N/A')}",
+                f"Description: {template_data.get('description', 'N/A')}",
+            ]
             
             files = template_data.get('files', {})
             if files:
-                console.print(f"\n📁 [bold]Files ({len(files)})[/bold]")
-                for file_path in files.keys():
-                    console.print(f"  • {file_path}")
+                lines.append(f"\n📁 [bold]Files ({len(files)})[/bold]")
+                lines.extend(f"  • {file_path}" for file_path in files)
+            
+            console.print("\n".join(lines))
         
         except Exception as e:
             console.print(f"❌ [red]Failed to load template: {e}[/red]")
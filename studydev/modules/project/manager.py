@@ -4,32 +4,155 @@ Handles project creation, templates, deadlines, and Git integration
 """
 
 import os
+import re
+import sys
+import errno
 import json
 import subprocess
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 import shutil
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Confirm
 
-from studydev.core.config import Config
-from studydev.core.database import Database
+from studydev.core import serialization
+from studydev.core.config import get_config
+from studydev.core.database import database_file_marker, get_db
 
 console = Console()
 
+
+# Written next to the templates once the built-in ones have been seeded
+_SEEDED_MARKER = ".seeded"
+
+# Placeholders substituted into template files, replaced in a single pass
+_PLACEHOLDER_RE = re.compile(r"\{\{(PROJECT_NAME|LANGUAGE|DATE|AUTHOR)\}\}")
+
+# Files in a template directory tree that get placeholder substitution (suffix is dropped)
+_TEMPLATE_SUFFIX = ".tmpl"
+
+# copy_file_range errors that mean "not supported here", so a plain copy is used instead
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL})
+
+# Deadline urgency indexed by days left + 1, clamped: overdue, due within a day,
+# within three days, later
+_URGENCY = ("overdue", "urgent", "urgent", "soon", "soon", "upcoming")
+
+# Whole days from today (local time) to a YYYY-MM-DD deadline; NULL for unparseable dates
+_DAYS_LEFT_SQL = "CAST(ROUND(julianday(deadline) - julianday('now', 'localtime', 'start of day')) AS INTEGER)"
+
+
+def _shorten_path(path: str, width: int) -> str:
+    """Shorten a path to at most width characters, keeping its trailing components"""
+    if not path or len(path) <= width:
+        return path
+    
+    prefix = "..." + os.sep
+    shortened = ""
+    for part in reversed(path.split(os.sep)):
+        candidate = part + os.sep + shortened if shortened else part
+        if len(prefix) + len(candidate) > width:
+            break
+        shortened = candidate
+    
+    if not shortened:
+        # A single component is already too long; keep its tail
+        return "..." + path[-(width - 3):]
+    return prefix + shortened
+
+def _copy_file(src: Path, dst: Path):
+    """Copy a file in the kernel with copy_file_range, which clones extents on CoW filesystems"""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copymode(src, dst)
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
+
+def _write_bytes(path: Path, data: bytes):
+    """Write a small file with raw os calls, skipping the io buffering layers"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _clone_template_tree(src: Path, dst: Path, substitute: Callable[[str], str]):
+    """Copy a template directory tree, filling placeholders only in .tmpl files"""
+    for root, _dirs, files in os.walk(src):
+        target_dir = dst / os.path.relpath(root, src)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        
+        for name in files:
+            source = Path(root) / name
+            if name.endswith(_TEMPLATE_SUFFIX):
+                target = target_dir / name[:-len(_TEMPLATE_SUFFIX)]
+                _write_bytes(target, substitute(source.read_text()).encode("utf-8"))
+            else:
+                _copy_file(source, target_dir / name)
+
+
 class ProjectManager:
     """Manages academic and coding projects with templates and Git integration"""
     
+    # Columns update_project may change
+    _UPDATABLE_FIELDS = frozenset({
+        "name", "description", "project_type", "language", "deadline", "status", "priority"
+    })
+    
+    # Columns list_projects may sort by
+    _SORT_FIELDS = frozenset({"name", "deadline", "priority", "created_at", "updated_at"})
+    
+    # Prebuilt ORDER BY clauses keyed by (sort field, ascending)
+    _ORDER_BY_SQL = {
+        (field, ascending): f" ORDER BY {field} {'ASC' if ascending else 'DESC'}"
+        for field in _SORT_FIELDS
+        for ascending in (True, False)
+    }
+    
+    # Set once the templates directory and default templates exist for this process
+    _initialized = False
+    
+    # Template file -> (mtime_ns, parsed template), shared across instances
+    _template_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+    
+    # Columns named as the keys of a project dictionary
+    _PROJECT_COLUMNS = f"""id, name, description, project_type AS type, language, path,
+               deadline, status, priority, created_at, updated_at,
+               {_DAYS_LEFT_SQL} AS days_until_deadline"""
+    
     def __init__(self):
-        self.config = Config()
-        self.db = Database()
-        self.templates_dir = Path(self.config.data_path) / "templates" / "projects"
-        self.templates_dir.mkdir(parents=True, exist_ok=True)
-        self._init_default_templates()
+        self.config = get_config()
+        self.db = get_db()
+        self.templates_dir = self.config.templates_dir / "projects"
+        self._ensure_initialized()
+        # list_projects results keyed by filters; cleared whenever projects change
+        self._list_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._projects_index_loaded = False
+        # Template name -> (file mtime_ns, metadata); loaded from the on-disk index on first use
+        self._template_meta_cache: Optional[Dict[str, tuple]] = None
+        self._template_index_dirty = False
+        # Sorted updated column names -> UPDATE statement text
+        self._update_stmt_cache: Dict[Tuple[str, ...], str] = {}
+        # Sorted template names; cleared when a template is written
+        self._templates_cache: Optional[List[str]] = None
     
     def create_project(self, name: str, project_type: str = "academic", 
                       language: str = None, template: str = None, 
@@ -64,11 +187,6 @@ class ProjectManager:
             template_name = template or language
             template_applied = self._apply_template(template_name, project_path, name, language)
         
-        # Initialize Git repository if enabled
-        git_repo = None
-        if self.config.get("project.default_git_init", True):
-            git_repo = self._init_git_repo(project_path)
-        
         # Parse deadline
         deadline_date = None
         if deadline:
@@ -78,22 +196,39 @@ class ProjectManager:
                 console.print(f"⚠️  [yellow]Invalid deadline format. Use YYYY-MM-DD[/yellow]")
         
         # Create database record
+        now_iso = datetime.now().isoformat()
         project_data = {
             "name": name,
             "description": description,
             "project_type": project_type,
             "language": language,
             "path": str(project_path),
-            "git_repo": git_repo,
+            "git_repo": None,
             "deadline": deadline_date,
             "status": "active",
             "priority": 3,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
-        # Insert into database
-        project_id = self._create_project_record(project_data)
+        # Initialize Git repository if enabled, overlapping it with the database insert;
+        # it has to follow the template so the initial commit includes its files
+        git_repo = None
+        if self.config.get("project.default_git_init", True):
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                git_future = executor.submit(self._init_git_repo, project_path)
+                project_id = self._create_project_record(project_data)
+                git_repo = git_future.result()
+            
+            if git_repo:
+                self.db.execute_update(
+                    "UPDATE projects SET git_repo = ? WHERE id = ?", (git_repo, project_id)
+                )
+                project_data["git_repo"] = git_repo
+        else:
+            project_id = self._create_project_record(project_data)
         project_data["id"] = project_id
         
         # Success message
@@ -111,129 +246,167 @@ class ProjectManager:
         }
     
     def list_projects(self, status: str = "all", project_type: str = "all",
-                     sort_by: str = "updated_at") -> List[Dict[str, Any]]:
+                     sort_by: str = "updated_at", has_deadline: bool = False,
+                     ascending: bool = False, limit: Optional[int] = None,
+                     offset: int = 0) -> List[Dict[str, Any]]:
         """List all projects with filtering options"""
         
+        # Days until deadline change at midnight, so the date is part of the key
+        cache_key = (status, project_type, sort_by, has_deadline, ascending, limit, offset, date.today())
+        self._load_projects_index()
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # Format results
+        project_list = list(self.iter_projects(
+            status, project_type, sort_by, has_deadline, ascending, limit, offset
+        ))
+        self._list_cache[cache_key] = project_list
+        self._save_projects_index()
+        
+        return list(project_list)
+    
+    def iter_projects(self, status: str = "all", project_type: str = "all",
+                      sort_by: str = "updated_at", has_deadline: bool = False,
+                      ascending: bool = False, limit: Optional[int] = None,
+                      offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Yield projects straight from the database cursor, bypassing the list cache"""
+        
         # Build query
-        query = """
-            SELECT id, name, description, project_type, language, path, 
-                   deadline, status, priority, created_at, updated_at
+        where, params = self._project_filters(status, project_type, has_deadline)
+        query = f"""
+            SELECT {self._PROJECT_COLUMNS}
             FROM projects
-            WHERE 1=1
+            WHERE {where}
         """
+        
+        # Add ordering
+        query += self._ORDER_BY_SQL.get((sort_by, ascending)) or self._ORDER_BY_SQL[("updated_at", ascending)]
+        
+        # Add paging
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, offset))
+        
+        # Rows are fetched in batches as the caller iterates, so stopping early stops the query
+        for project in self.db.execute_query_iter(query, tuple(params), batch_size=100):
+            yield self._format_project(project)
+    
+    def _projects_index_path(self) -> Path:
+        """Location of the on-disk project list index"""
+        return self.config.cache_dir / "projects_index.json"
+    
+    def _load_projects_index(self):
+        """Seed the list cache from the on-disk index if the database is unchanged since it was written"""
+        if self._projects_index_loaded:
+            return
+        self._projects_index_loaded = True
+        
+        today = date.today()
+        try:
+            index = serialization.loads(self._projects_index_path().read_bytes())
+            if (index["date"] != today.isoformat()
+                    or tuple(index["marker"]) != database_file_marker(self.db.db_path)):
+                return
+            for key, projects in index["lists"]:
+                self._list_cache.setdefault((*key, today), projects)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable index, lists are read from the database
+    
+    def _save_projects_index(self):
+        """Write today's cached project lists to the on-disk index"""
+        today = date.today()
+        index = {
+            "date": today.isoformat(),
+            "marker": database_file_marker(self.db.db_path),
+            "lists": [
+                [list(key[:-1]), projects]
+                for key, projects in self._list_cache.items() if key[-1] == today
+            ]
+        }
+        index_path = self._projects_index_path()
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(serialization.dumps(index))
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass  # The index is only a cache
+    
+    def _invalidate_project_lists(self):
+        """Drop cached project lists and session project ids after projects change"""
+        self._list_cache.clear()
+        
+        # The session manager's cache can only hold ids if the module has been loaded
+        session_manager = sys.modules.get("studydev.modules.session.manager")
+        if session_manager is not None:
+            session_manager.SessionManager.invalidate_project_cache()
+        try:
+            self._projects_index_path().unlink()
+        except FileNotFoundError:
+            pass
+    
+    def count_projects(self, status: str = "all", project_type: str = "all",
+                       has_deadline: bool = False) -> int:
+        """Count projects matching the list_projects filters"""
+        where, params = self._project_filters(status, project_type, has_deadline)
+        return self.db.execute_query(f"SELECT COUNT(*) FROM projects WHERE {where}", tuple(params))[0][0]
+    
+    def _project_filters(self, status: str, project_type: str,
+                         has_deadline: bool) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and parameters shared by list_projects and count_projects"""
+        clauses = ["1=1"]
         params = []
         
         if status != "all":
-            query += " AND status = ?"
+            clauses.append("status = ?")
             params.append(status)
         
         if project_type != "all":
-            query += " AND project_type = ?"
+            clauses.append("project_type = ?")
             params.append(project_type)
         
-        # Add ordering
-        valid_sort_fields = ["name", "deadline", "priority", "created_at", "updated_at"]
-        if sort_by in valid_sort_fields:
-            query += f" ORDER BY {sort_by} DESC"
-        else:
-            query += " ORDER BY updated_at DESC"
-        
-        # Execute query
-        projects = self.db.execute_query(query, tuple(params))
+        if has_deadline:
+            clauses.append("deadline IS NOT NULL")
         
-        # Format results
-        project_list = []
-        for project in projects:
-            project_data = {
-                "id": project[0],
-                "name": project[1],
-                "description": project[2],
-                "type": project[3],
-                "language": project[4],
-                "path": project[5],
-                "deadline": project[6],
-                "status": project[7],
-                "priority": project[8],
-                "created_at": project[9],
-                "updated_at": project[10],
-                "days_until_deadline": self._days_until_deadline(project[6])
-            }
-            project_list.append(project_data)
-        
-        return project_list
+        return " AND ".join(clauses), params
+    
+    def get_project(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single project by ID"""
+        project = self.db.execute_query(
+            f"SELECT {self._PROJECT_COLUMNS} FROM projects WHERE id = ?", (project_id,)
+        )
+        return self._format_project(project[0]) if project else None
+    
+    def _format_project(self, project) -> Dict[str, Any]:
+        """Convert a projects row into a project dictionary"""
+        return {**dict(project), "path_display": _shorten_path(project["path"], 40)}
     
     def get_upcoming_deadlines(self, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """Get projects with deadlines in the specified number of days"""
         
         target_date = (date.today() + timedelta(days=days_ahead)).isoformat()
         
-        projects = self.db.execute_query("""
-            SELECT id, name, deadline, status, priority
+        projects = self.db.execute_query(f"""
+            SELECT id, name, deadline, status, priority, {_DAYS_LEFT_SQL} AS days_left
             FROM projects 
             WHERE deadline IS NOT NULL 
                 AND deadline <= ? 
-                AND status != 'completed'
-                AND status != 'cancelled'
+                AND status NOT IN ('completed', 'cancelled')
             ORDER BY deadline ASC
         """, (target_date,))
         
         deadlines = []
         for project in projects:
-            project_id, name, deadline, status, priority = project
-            days_left = self._days_until_deadline(deadline)
+            days_left = project["days_left"]
             
             # Determine urgency
-            if days_left < 0:
-                urgency = "overdue"
-            elif days_left <= 1:
-                urgency = "urgent"
-            elif days_left <= 3:
-                urgency = "soon"
-            else:
-                urgency = "upcoming"
+            urgency = _URGENCY[min(max(days_left + 1, 0), len(_URGENCY) - 1)]
             
-            deadlines.append({
-                "id": project_id,
-                "name": name,
-                "deadline": deadline,
-                "days_left": days_left,
-                "status": status,
-                "priority": priority,
-                "urgency": urgency
-            })
+            deadlines.append({**dict(project), "urgency": urgency})
         
         return deadlines
     
-    def update_project(self, project_id: int, **updates) -> bool:
-        """Update project fields"""
-        
-        # Build update query dynamically
-        valid_fields = {
-            "name", "description", "project_type", "language", 
-            "deadline", "status", "priority"
-        }
-        
-        update_fields = []
-        params = []
-        
-        for field, value in updates.items():
-            if field in valid_fields:
-                update_fields.append(f"{field} = ?")
-                params.append(value)
-        
-        if not update_fields:
-            return False
-        
-        # Add updated timestamp
-        update_fields.append("updated_at = ?")
-        params.append(datetime.now().isoformat())
-        params.append(project_id)
-        
-        query = f"UPDATE projects SET {', '.join(update_fields)} WHERE id = ?"
-        
-        rows_affected = self.db.execute_update(query, tuple(params))
-        return rows_affected > 0
-    
     def delete_project(self, project_id: int, remove_files: bool = False) -> bool:
         """Delete a project and optionally its files"""
         
@@ -260,6 +433,7 @@ class ProjectManager:
         rows_affected = self.db.execute_update(
             "DELETE FROM projects WHERE id = ?", (project_id,)
         )
+        self._invalidate_project_lists()
         
         if rows_affected > 0:
             console.print(f"✅ [green]Project '{project_name}' deleted from database[/green]")
@@ -269,14 +443,82 @@ class ProjectManager:
     
     def get_project_templates(self) -> List[str]:
         """Get list of available project templates"""
-        templates = []
+        if self._templates_cache is None:
+            self._templates_cache = sorted(
+                entry.stem for entry in self.templates_dir.iterdir() if entry.suffix == ".json"
+            )
+        return list(self._templates_cache)
+    
+    def get_template_meta(self, template_name: str) -> Optional[Dict[str, str]]:
+        """Get a template's language and description, re-parsing only if the file changed"""
+        template_file = self.templates_dir / f"{template_name}.json"
+        try:
+            mtime_ns = template_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
         
-        # Get built-in templates
-        for template_file in self.templates_dir.glob("*.json"):
-            template_name = template_file.stem
-            templates.append(template_name)
+        cache = self._load_template_index()
+        cached = cache.get(template_name)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        try:
+            template_data = serialization.loads(template_file.read_bytes())
+            meta = {
+                "language": template_data.get("language", "N/A"),
+                "description": template_data.get("description", "No description")
+            }
+        except (ValueError, OSError, AttributeError):
+            meta = {"language": "Unknown", "description": "Template file corrupted"}
         
-        return sorted(templates)
+        cache[template_name] = (mtime_ns, meta)
+        self._template_index_dirty = True
+        return meta
+    
+    def get_templates_meta(self) -> Dict[str, Optional[Dict[str, str]]]:
+        """Get metadata for every template, saving the on-disk index if anything changed"""
+        templates = {name: self.get_template_meta(name) for name in self.get_project_templates()}
+        
+        # Forget templates that have been removed
+        cache = self._load_template_index()
+        for stale in cache.keys() - templates.keys():
+            del cache[stale]
+            self._template_index_dirty = True
+        
+        if self._template_index_dirty:
+            self._save_template_index()
+        return templates
+    
+    def _template_index_path(self) -> Path:
+        """Location of the template metadata index"""
+        return self.config.cache_dir / "project_templates.json"
+    
+    def _load_template_index(self) -> Dict[str, tuple]:
+        """Load the template metadata index once per manager"""
+        if self._template_meta_cache is None:
+            try:
+                index = serialization.loads(self._template_index_path().read_bytes())
+                self._template_meta_cache = {
+                    name: (entry["mtime_ns"], entry["meta"]) for name, entry in index.items()
+                }
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                self._template_meta_cache = {}
+        return self._template_meta_cache
+    
+    def _save_template_index(self):
+        """Write the template metadata index atomically"""
+        index = {
+            name: {"mtime_ns": mtime_ns, "meta": meta}
+            for name, (mtime_ns, meta) in self._template_meta_cache.items()
+        }
+        index_path = self._template_index_path()
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(serialization.dumps(index))
+            os.replace(tmp_path, index_path)
+            self._template_index_dirty = False
+        except OSError:
+            pass  # The index is only a cache
     
     def create_template(self, name: str, language: str, files: Dict[str, str],
                        dependencies: List[str] = None) -> bool:
@@ -296,6 +538,7 @@ class ProjectManager:
         try:
             with open(template_path, 'w') as f:
                 json.dump(template_data, f, indent=4)
+            self._templates_cache = None
             
             console.print(f"✅ [green]Template '{name}' created successfully[/green]")
             return True
@@ -309,27 +552,44 @@ class ProjectManager:
         
         template_file = self.templates_dir / f"{template_name}.json"
         
-        if not template_file.exists():
+        try:
+            mtime_ns = template_file.stat().st_mtime_ns
+        except FileNotFoundError:
             console.print(f"⚠️  [yellow]Template '{template_name}' not found[/yellow]")
             return False
         
         try:
-            with open(template_file, 'r') as f:
-                template = json.load(f)
+            cached = self._template_cache.get(template_file)
+            if cached and cached[0] == mtime_ns:
+                template = cached[1]
+            else:
+                with open(template_file, 'r') as f:
+                    template = json.load(f)
+                self._template_cache[template_file] = (mtime_ns, template)
+            
+            placeholders = {
+                "PROJECT_NAME": project_name,
+                "LANGUAGE": language or "",
+                "DATE": datetime.now().strftime("%Y-%m-%d"),
+                "AUTHOR": self.config.get("user.name", ""),
+            }
+            
+            def substitute(content: str) -> str:
+                return _PLACEHOLDER_RE.sub(lambda m: placeholders[m.group(1)], content)
+            
+            # Create template files, making each parent directory only once
+            files = {project_path / file_path: content
+                     for file_path, content in template.get("files", {}).items()}
+            for parent in {file_full_path.parent for file_full_path in files}:
+                parent.mkdir(parents=True, exist_ok=True)
+            
+            for file_full_path, content in files.items():
+                _write_bytes(file_full_path, substitute(content).encode("utf-8"))
             
-            # Create template files
-            for file_path, content in template.get("files", {}).items():
-                file_full_path = project_path / file_path
-                file_full_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Replace placeholders in content
-                content = content.replace("{{PROJECT_NAME}}", project_name)
-                content = content.replace("{{LANGUAGE}}", language or "")
-                content = content.replace("{{DATE}}", datetime.now().strftime("%Y-%m-%d"))
-                content = content.replace("{{AUTHOR}}", self.config.get("user.name", ""))
-                
-                with open(file_full_path, 'w') as f:
-                    f.write(content)
+            # Templates may ship a directory tree (assets, notebooks, ...) next to the JSON
+            template_tree = self.templates_dir / template_name
+            if template_tree.is_dir():
+                _clone_template_tree(template_tree, project_path, substitute)
             
             console.print(f"📋 [green]Template '{template_name}' applied successfully[/green]")
             return True
@@ -342,27 +602,39 @@ class ProjectManager:
         """Initialize Git repository and return remote URL if set"""
         
         try:
-            # Initialize git repo
-            subprocess.run(
-                ["git", "init"], 
-                cwd=project_path, 
-                capture_output=True, 
-                check=True
-            )
-            
+            import pygit2
+        except ImportError:  # pygit2 is optional; fall back to the git CLI
+            pygit2 = None
+        git_errors = (subprocess.CalledProcessError, FileNotFoundError)
+        if pygit2 is not None:
+            git_errors += (pygit2.GitError, KeyError)
+        
+        try:
             # Create initial commit if files exist
-            files = list(project_path.glob("*"))
-            if files:
+            has_files = any(project_path.iterdir())
+            
+            if pygit2 is not None:
+                # In-process: no git subprocesses at all
+                repo = pygit2.init_repository(str(project_path))
+                if has_files:
+                    index = repo.index
+                    index.add_all()
+                    index.write()
+                    signature = repo.default_signature
+                    repo.create_commit("HEAD", signature, signature, "Initial commit",
+                                       index.write_tree(), [])
+            elif has_files:
+                # One shell spawn for init, add and commit instead of three git processes
                 subprocess.run(
-                    ["git", "add", "."], 
+                    'git init -q && git add . && git commit -q -m "Initial commit"',
+                    shell=True,
                     cwd=project_path, 
                     capture_output=True, 
                     check=True
                 )
-                
+            else:
                 subprocess.run(
-                    ["git", "commit", "-m", "Initial commit"], 
-                    cwd=project_path, 
+                    ["git", "-C", str(project_path), "init", "-q"], 
                     capture_output=True, 
                     check=True
                 )
@@ -370,14 +642,14 @@ class ProjectManager:
             console.print("🔧 [green]Git repository initialized[/green]")
             return str(project_path)
             
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        except git_errors as e:
             console.print("⚠️  [yellow]Git initialization failed - continuing without Git[/yellow]")
             return None
     
     def _create_project_record(self, project_data: Dict[str, Any]) -> int:
         """Create project record in database and return ID"""
         
-        self.db.execute_update("""
+        project_id = self.db.execute_insert("""
             INSERT INTO projects (
                 name, description, project_type, language, path, 
                 git_repo, deadline, status, priority, created_at, updated_at
@@ -396,24 +668,24 @@ class ProjectManager:
             project_data["updated_at"]
         ))
         
-        # Get the ID of inserted record
-        project_id = self.db.execute_query("SELECT last_insert_rowid()")[0][0]
+        self._invalidate_project_lists()
         return project_id
     
-    def _days_until_deadline(self, deadline_str: str) -> Optional[int]:
-        """Calculate days until deadline"""
-        if not deadline_str:
-            return None
-        
-        try:
-            deadline_date = datetime.strptime(deadline_str, "%Y-%m-%d").date()
-            return (deadline_date - date.today()).days
-        except ValueError:
-            return None
+    def _ensure_initialized(self):
+        """Create the templates directory and default templates once per process"""
+        if ProjectManager._initialized:
+            return
+        self._init_default_templates()
+        ProjectManager._initialized = True
     
     def _init_default_templates(self):
         """Initialize default project templates"""
         
+        seeded_marker = self.templates_dir / _SEEDED_MARKER
+        if seeded_marker.exists():
+            return
+        self.templates_dir.mkdir(parents=True, exist_ok=True)
+        
         templates = {
             "python": {
                 "name": "python",
@@ -441,16 +713,27 @@ class ProjectManager:
         }
         
         # Create template files if they don't exist
+        existing = {entry.name for entry in self.templates_dir.iterdir()}
         for template_name, template_data in templates.items():
-            template_file = self.templates_dir / f"{template_name}.json"
+            file_name = f"{template_name}.json"
             
-            if not template_file.exists():
-                with open(template_file, 'w') as f:
+            if file_name not in existing:
+                with open(self.templates_dir / file_name, 'w') as f:
                     json.dump(template_data, f, indent=4)
+                self._templates_cache = None
+        
+        seeded_marker.touch()
     
     def update_project(self, project_id: int, **updates) -> Dict[str, Any]:
         """Update project fields in the database"""
         
+        invalid_fields = updates.keys() - self._UPDATABLE_FIELDS
+        if invalid_fields:
+            return {
+                "success": False,
+                "message": f"Cannot update field(s): {', '.join(sorted(invalid_fields))}"
+            }
+        
         if not updates:
             return {
                 "success": False,
@@ -458,27 +741,22 @@ class ProjectManager:
             }
         
         try:
-            # Build update query dynamically
-            set_clauses = []
-            values = []
-            
-            # Add updated_at timestamp
-            updates['updated_at'] = datetime.now().isoformat()
-            
-            for field, value in updates.items():
-                set_clauses.append(f"{field} = ?")
-                values.append(value)
+            # One UPDATE covering every changed column; the SQL text is cached per column
+            # set so SQLite's statement cache sees the same string each time
+            fields = tuple(sorted(updates))
+            query = self._update_stmt_cache.get(fields)
+            if query is None:
+                set_clauses = ", ".join(f"{field} = ?" for field in fields)
+                query = self._update_stmt_cache[fields] = (
+                    f"UPDATE projects SET {set_clauses}, updated_at = ? WHERE id = ?"
+                )
             
-            # Add project_id for WHERE clause
+            values = [updates[field] for field in fields]
+            values.append(datetime.now().isoformat())
             values.append(project_id)
             
-            query = f"""
-                UPDATE projects 
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-            """
-            
             self.db.execute_update(query, tuple(values))
+            self._invalidate_project_lists()
             
             return {
                 "success": True,
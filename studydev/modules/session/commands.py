@@ -3,13 +3,16 @@ StudyDev Session Management Commands
 Handles Pomodoro timer, task tracking, and time logging
 """
 
+import time
+from functools import lru_cache
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
 
-from studydev.modules.session.manager import SessionManager
+from studydev.utils.dashboard_cache import invalidate_dashboard_cache
 
 console = Console()
 
@@ -19,15 +22,34 @@ session_app = typer.Typer(
     rich_markup_mode="rich"
 )
 
+# Star strings for whole ratings 0-5
+_STARS = tuple("⭐" * i for i in range(6))
+
+
+@lru_cache(maxsize=1)
+def _session_manager():
+    """Get the shared SessionManager for this process"""
+    from studydev.modules.session.manager import SessionManager
+    return SessionManager()
+
+
+def _countdown(seconds: int = 3):
+    """Count down one second at a time so Ctrl+C is handled between ticks"""
+    for remaining in range(seconds, 0, -1):
+        console.print(f"[dim]{remaining}...[/dim]")
+        time.sleep(1)
+
+
 @session_app.command("start")
 def start_session(
     session_type: str = typer.Option("study", help="Type of session (study/break/project)"),
     duration: int = typer.Option(25, help="Duration in minutes"),
     subject: str = typer.Option(None, help="Subject or topic for this session"),
-    project: str = typer.Option(None, help="Associated project name")
+    project: str = typer.Option(None, help="Associated project name"),
+    no_countdown: bool = typer.Option(False, "--no-countdown", help="Start the timer immediately")
 ):
     """🚀 Start a new study/work session with Pomodoro timer"""
-    manager = SessionManager()
+    manager = _session_manager()
     
     console.print(f"\n🎯 Starting {session_type} session for {duration} minutes")
     if subject:
@@ -36,10 +58,9 @@ def start_session(
         console.print(f"📝 Project: {project}")
     
     console.print("\n⏰ [cyan]Press Ctrl+C to pause the timer[/cyan]")
-    console.print("[dim]Timer will start in 3 seconds...[/dim]")
-    
-    import time
-    time.sleep(3)
+    if not no_countdown:
+        console.print("[dim]Timer will start in 3 seconds...[/dim]")
+        _countdown()
     
     # Start the actual session
     result = manager.start_session(
@@ -54,17 +75,17 @@ def start_session(
 
 @session_app.command("break")
 def take_break(
-    duration: int = typer.Option(5, help="Break duration in minutes")
+    duration: int = typer.Option(5, help="Break duration in minutes"),
+    no_countdown: bool = typer.Option(False, "--no-countdown", help="Start the timer immediately")
 ):
     """☕ Take a break with timer"""
-    manager = SessionManager()
+    manager = _session_manager()
     
     console.print(f"\n☕ Starting {duration}-minute break")
     console.print("\n⏰ [cyan]Press Ctrl+C to pause the break timer[/cyan]")
-    console.print("[dim]Break timer will start in 3 seconds...[/dim]")
-    
-    import time
-    time.sleep(3)
+    if not no_countdown:
+        console.print("[dim]Break timer will start in 3 seconds...[/dim]")
+        _countdown()
     
     # Start break session
     result = manager.start_session(
@@ -79,13 +100,13 @@ def take_break(
 @session_app.command("pause")
 def pause_session():
     """⏸️  Pause the current session"""
-    manager = SessionManager()
+    manager = _session_manager()
     manager.pause_session()
 
 @session_app.command("resume")
 def resume_session():
     """▶️  Resume a paused session"""
-    manager = SessionManager()
+    manager = _session_manager()
     manager.resume_session()
 
 @session_app.command("stop")
@@ -93,7 +114,7 @@ def stop_session(
     rating: int = typer.Option(None, help="Rate your productivity (1-5)", min=1, max=5)
 ):
     """🛑 Stop the current session"""
-    manager = SessionManager()
+    manager = _session_manager()
     
     if rating is None:
         # Ask for rating interactively
@@ -109,13 +130,14 @@ def stop_session(
             rating = 3
     
     manager.stop_session(rating)
+    invalidate_dashboard_cache()
 
 @session_app.command("stats")
 def show_stats(
     period: str = typer.Option("today", help="Time period (today/week/month/all)")
 ):
     """📈 Show session statistics and productivity metrics"""
-    manager = SessionManager()
+    manager = _session_manager()
     stats = manager.get_session_stats(period)
     
     # Create main stats panel
@@ -125,7 +147,7 @@ def show_stats(
     stats_text.append(f"⏱️  Total Time: {stats['total_time_hours']} hours\n", style="green")
     
     if stats['average_rating'] > 0:
-        stars = "⭐" * int(stats['average_rating'])
+        stars = _STARS[int(stats['average_rating'])]
         stats_text.append(f"🎆 Average Rating: {stats['average_rating']}/5 {stars}\n", style="yellow")
     
     stats_panel = Panel(stats_text, title="Overview", border_style="blue")
@@ -175,10 +197,10 @@ def show_history(
     limit: int = typer.Option(10, help="Number of recent sessions to show")
 ):
     """📚 Show recent session history"""
-    manager = SessionManager()
+    manager = _session_manager()
     history = manager.get_session_history(limit)
     
-    if not history:
+    if not history['id']:
         console.print("\n📚 [yellow]No session history found. Start your first session![/yellow]")
         return
     
@@ -194,26 +216,21 @@ def show_history(
     history_table.add_column("Rating", justify="center")
     history_table.add_column("Status", justify="center")
     
-    for session in history:
-        # Format datetime
-        from datetime import datetime
-        dt = datetime.fromisoformat(session['start_time'])
-        date_str = dt.strftime("%m-%d %H:%M")
-        
-        # Format rating
-        rating = "⭐" * session['rating'] if session['rating'] else "N/A"
-        
-        # Status icon
-        status_icon = "✅" if session['status'] == "completed" else "⏸️"
+    for start, session_type, subject, project, minutes, rating, status in zip(
+        history['start_time'], history['type'], history['subject'], history['project'],
+        history['duration_minutes'], history['rating'], history['status']
+    ):
+        # Format datetime straight from the ISO string (YYYY-MM-DDTHH:MM:SS)
+        date_str = f"{start[5:7]}-{start[8:10]} {start[11:13]}:{start[14:16]}"
         
         history_table.add_row(
             date_str,
-            session['type'].title(),
-            session['subject'] or "N/A",
-            session['project'] or "N/A",
-            f"{session['duration_minutes']}m",
-            rating,
-            status_icon
+            session_type.title(),
+            subject or "N/A",
+            project or "N/A",
+            f"{minutes}m",
+            _STARS[rating] if rating else "N/A",
+            "✅" if status == "completed" else "⏸️"
         )
     
     console.print(history_table)
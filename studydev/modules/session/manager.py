@@ -3,6 +3,7 @@ StudyDev Session Manager - Core Logic
 Handles Pomodoro timer, session tracking, and productivity analytics
 """
 
+import sys
 import time
 import threading
 from datetime import datetime, timedelta
@@ -10,30 +11,49 @@ from typing import Optional, Dict, Any, List
 import json
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn, BarColumn
 from rich.panel import Panel
 from rich.text import Text
 from rich.live import Live
-from rich.table import Table
 
-from studydev.core.config import Config
-from studydev.core.database import Database
+from studydev.core.config import get_config
+from studydev.core.database import get_db
 from studydev.utils.interactive import InteractiveUI
 
 console = Console()
 
+# Shared by completion and early stop so both reuse one cached prepared statement
+_FINISH_SESSION_SQL = "UPDATE sessions SET end_time = ?, duration = ?, productivity_rating = ? WHERE id = ?"
+
 class SessionManager:
     """Manages study sessions with Pomodoro timer functionality"""
     
+    # Project name -> id (None if no such project), shared by all instances
+    _project_ids: Dict[str, Optional[int]] = {}
+    
     def __init__(self):
-        self.config = Config()
-        self.db = Database()
+        self.config = get_config()
+        self.db = get_db()
         self.interactive_ui = InteractiveUI()
         self.current_session = None
         self.timer_thread = None
         self.is_running = False
-        self.is_paused = False
+        # Set by pause_session/resume_session and stop_session, read by the timer thread
+        self._paused = threading.Event()
+        self._stop_requested = threading.Event()
         self.remaining_time = 0
+        self.notification_sound = self.config.get("session.notification_sound", True)
+    
+    @property
+    def is_paused(self) -> bool:
+        """Whether the running session is paused"""
+        return self._paused.is_set()
+    
+    @is_paused.setter
+    def is_paused(self, paused: bool):
+        if paused:
+            self._paused.set()
+        else:
+            self._paused.clear()
         
     def start_session(self, session_type: str = "study", duration: int = 25, 
                      subject: str = None, project: str = None) -> Dict[str, Any]:
@@ -78,67 +98,121 @@ class SessionManager:
         """Display interactive timer with progress"""
         
         total_seconds = duration_minutes * 60
-        start_time = time.time()
+        
+        # Everything that doesn't change per tick is worked out once
+        header = ("🍅 " if session_type == "study" else "☕ ", f"{session_type.title()} Session")
+        title = f"StudyDev Timer - {session_type.title()}"
+        bar_width = 30
+        percent_scale = 100.0 / total_seconds
+        # (remaining above, message, style) from the first to the last quarter
+        phases = (
+            (total_seconds * 0.75, "\n💪 Stay focused! You've got this!", "bold cyan"),
+            (total_seconds * 0.5, "\n🔥 Great progress! Keep going!", "bold yellow"),
+            (total_seconds * 0.25, "\n🎯 Almost there! Push through!", "bold orange"),
+        )
+        final_phase = ("\n🏁 Final stretch! You're amazing!", "bold red")
         
         # Create a beautiful timer display
         def create_timer_display(elapsed: int, remaining: int):
-            # Calculate progress
-            progress_percent = (elapsed / total_seconds) * 100
-            
             # Create main panel content
             timer_text = Text()
-            timer_text.append("🍅 " if session_type == "study" else "☕ ", style="bold")
-            timer_text.append(f"{session_type.title()} Session", style="bold blue")
+            timer_text.append(header[0], style="bold")
+            timer_text.append(header[1], style="bold blue")
             
             if subject:
                 timer_text.append(f"\n📚 {subject}", style="dim")
             
             # Format time remaining
             minutes, seconds = divmod(remaining, 60)
-            time_str = f"{minutes:02d}:{seconds:02d}"
-            timer_text.append(f"\n\n⏰ {time_str}", style="bold green" if remaining > 60 else "bold red")
+            timer_text.append(f"\n\n⏰ {minutes:02d}:{seconds:02d}", style="bold green" if remaining > 60 else "bold red")
             
-            # Add progress bar
-            bar_width = 30
-            filled = int((progress_percent / 100) * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
-            timer_text.append(f"\n{bar} {progress_percent:.1f}%", style="blue")
+            # Add progress bar, filled with integer math
+            filled = (elapsed * bar_width) // total_seconds
+            timer_text.append(
+                f"\n{'█' * filled}{'░' * (bar_width - filled)} {elapsed * percent_scale:.1f}%", style="blue"
+            )
             
             # Add motivational messages based on time remaining
-            if remaining > total_seconds * 0.75:
-                timer_text.append("\n💪 Stay focused! You've got this!", style="bold cyan")
-            elif remaining > total_seconds * 0.5:
-                timer_text.append("\n🔥 Great progress! Keep going!", style="bold yellow")
-            elif remaining > total_seconds * 0.25:
-                timer_text.append("\n🎯 Almost there! Push through!", style="bold orange")
-            else:
-                timer_text.append("\n🏁 Final stretch! You're amazing!", style="bold red")
+            message, style = next(
+                ((message, style) for threshold, message, style in phases if remaining > threshold),
+                final_phase
+            )
+            timer_text.append(message, style=style)
             
             return Panel(
                 timer_text,
-                title=f"StudyDev Timer - {session_type.title()}",
+                title=title,
                 border_style="green" if remaining > 60 else "red",
                 expand=False
             )
         
-        # Timer loop with live display
+        # Tick in a worker thread; the calling thread only waits, so Ctrl+C and the
+        # completion prompt are handled here rather than inside the Live loop
+        self._stop_requested.clear()
+        self.timer_thread = threading.Thread(
+            target=self._run_timer,
+            args=(total_seconds, create_timer_display),
+            daemon=True
+        )
+        self.timer_thread.start()
+        
         try:
-            with Live(create_timer_display(0, total_seconds), refresh_per_second=1, console=console) as live:
-                while self.remaining_time > 0 and self.is_running:
-                    if not self.is_paused:
-                        elapsed = int(time.time() - start_time)
-                        self.remaining_time = max(0, total_seconds - elapsed)
-                        live.update(create_timer_display(elapsed, self.remaining_time))
-                    
-                    time.sleep(1)
-                
-                # Timer completed
-                if self.remaining_time <= 0:
-                    self._session_completed(duration_minutes, session_type)
-                    
+            while self.timer_thread.is_alive():
+                self.timer_thread.join(0.5)
         except KeyboardInterrupt:
             self.pause_session()
+            self._stop_timer()
             console.print("\n⏸️  [yellow]Session paused. Use 'studydev session resume' to continue or 'studydev session stop' to end.[/yellow]")
+            return
+        
+        # Timer completed
+        if self.remaining_time <= 0 and self.current_session:
+            self._session_completed(duration_minutes, session_type)
+    
+    def _run_timer(self, total_seconds: int, create_timer_display):
+        """Timer thread: tick once per second boundary until done or asked to stop"""
+        # Monotonic clock so wall-clock adjustments don't jump the timer
+        start_time = time.monotonic()
+        paused_total = 0.0
+        paused_since = None
+        
+        # Redraw only when the displayed time changes
+        with Live(create_timer_display(0, total_seconds), auto_refresh=False, console=console) as live:
+            shown_remaining = total_seconds
+            next_tick = start_time
+            while not self._stop_requested.is_set():
+                now = time.monotonic()
+                if self._paused.is_set():
+                    if paused_since is None:
+                        paused_since = now
+                else:
+                    if paused_since is not None:
+                        # Paused time doesn't count towards the session
+                        paused_total += now - paused_since
+                        paused_since = None
+                    
+                    elapsed = int(now - start_time - paused_total)
+                    self.remaining_time = max(0, total_seconds - elapsed)
+                    if self.remaining_time != shown_remaining:
+                        shown_remaining = self.remaining_time
+                        live.update(create_timer_display(elapsed, shown_remaining), refresh=True)
+                    if self.remaining_time <= 0:
+                        break
+                
+                next_tick += 1
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    # Sleeps like time.sleep but wakes at once when a stop is requested
+                    self._stop_requested.wait(delay)
+                else:
+                    next_tick = time.monotonic()  # Fell behind (e.g. suspended); resync
+    
+    def _stop_timer(self):
+        """Ask the timer thread to finish and wait for it"""
+        self._stop_requested.set()
+        if (self.timer_thread is not None and self.timer_thread.is_alive()
+                and self.timer_thread is not threading.current_thread()):
+            self.timer_thread.join()
     
     def _session_completed(self, duration_minutes: int, session_type: str):
         """Handle session completion with beautiful celebration"""
@@ -158,10 +232,12 @@ class SessionManager:
             default=4
         )
         
-        self.db.execute_update(
-            "UPDATE sessions SET end_time = ?, duration = ?, productivity_rating = ? WHERE id = ?",
-            (end_time, int(actual_duration), rating, self.current_session["id"])
-        )
+        # The prompt stays outside the transaction so it never holds the write lock
+        with self.db.transaction() as cursor:
+            cursor.execute(
+                _FINISH_SESSION_SQL,
+                (end_time, int(actual_duration), rating, self.current_session["id"])
+            )
         
         # Show beautiful completion celebration
         self.interactive_ui.show_completion_celebration(
@@ -206,16 +282,19 @@ class SessionManager:
             console.print("❌ [red]No active session to stop.[/red]")
             return False
         
+        self._stop_timer()
+        
         # Update session record
         if self.current_session:
             end_time = datetime.now().isoformat()
             actual_duration = (datetime.fromisoformat(end_time) - 
                              datetime.fromisoformat(self.current_session["start_time"])).total_seconds()
             
-            self.db.execute_update(
-                "UPDATE sessions SET end_time = ?, duration = ?, productivity_rating = ? WHERE id = ?",
-                (end_time, int(actual_duration), rating or 3, self.current_session["id"])
-            )
+            with self.db.transaction() as cursor:
+                cursor.execute(
+                    _FINISH_SESSION_SQL,
+                    (end_time, int(actual_duration), rating or 3, self.current_session["id"])
+                )
         
         # Reset state
         self.is_running = False
@@ -239,64 +318,63 @@ class SessionManager:
         else:  # all
             start_date = datetime(2000, 1, 1)
         
-        # Query database
-        sessions = self.db.execute_query("""
-            SELECT session_type, subject, duration, productivity_rating, start_time
-            FROM sessions 
+        # Aggregate in SQL; groups are ordered by their most recent session
+        params = (start_date.isoformat(),)
+        total_sessions, total_time, rating_total = self.db.execute_query("""
+            SELECT COUNT(*), TOTAL(duration), TOTAL(productivity_rating)
+            FROM sessions
             WHERE start_time >= ? AND end_time IS NOT NULL
-            ORDER BY start_time DESC
-        """, (start_date.isoformat(),))
+        """, params)[0]
+        total_time = int(total_time)
         
-        # Calculate statistics
         stats = {
-            "total_sessions": len(sessions),
-            "total_time_seconds": sum(s[2] or 0 for s in sessions),
-            "total_time_hours": round(sum(s[2] or 0 for s in sessions) / 3600, 2),
-            "average_rating": round(sum(s[3] or 0 for s in sessions) / len(sessions), 2) if sessions else 0,
+            "total_sessions": total_sessions,
+            "total_time_seconds": total_time,
+            "total_time_hours": round(total_time / 3600, 2),
+            "average_rating": round(rating_total / total_sessions, 2) if total_sessions else 0,
             "subjects": {},
             "session_types": {},
             "daily_breakdown": {}
         }
         
-        # Break down by subject and type
-        for session in sessions:
-            session_type, subject, duration, rating, start_time = session
-            duration = duration or 0
-            
-            # Subject breakdown
-            if subject:
-                if subject not in stats["subjects"]:
-                    stats["subjects"][subject] = {"sessions": 0, "time": 0, "rating": []}
-                stats["subjects"][subject]["sessions"] += 1
-                stats["subjects"][subject]["time"] += duration
-                if rating:
-                    stats["subjects"][subject]["rating"].append(rating)
-            
-            # Session type breakdown
-            if session_type not in stats["session_types"]:
-                stats["session_types"][session_type] = {"sessions": 0, "time": 0}
-            stats["session_types"][session_type]["sessions"] += 1
-            stats["session_types"][session_type]["time"] += duration
-            
-            # Daily breakdown
-            day = datetime.fromisoformat(start_time).date().isoformat()
-            if day not in stats["daily_breakdown"]:
-                stats["daily_breakdown"][day] = {"sessions": 0, "time": 0}
-            stats["daily_breakdown"][day]["sessions"] += 1
-            stats["daily_breakdown"][day]["time"] += duration
-        
-        # Calculate average ratings for subjects
-        for subject_data in stats["subjects"].values():
-            if subject_data["rating"]:
-                subject_data["avg_rating"] = round(sum(subject_data["rating"]) / len(subject_data["rating"]), 2)
-            else:
-                subject_data["avg_rating"] = 0
-            del subject_data["rating"]  # Remove raw ratings list
+        # Subject breakdown; unrated (NULL or 0) sessions don't count towards the average
+        for subject, sessions, time_spent, avg_rating in self.db.execute_query("""
+            SELECT subject, COUNT(*), TOTAL(duration), AVG(NULLIF(productivity_rating, 0))
+            FROM sessions
+            WHERE start_time >= ? AND end_time IS NOT NULL AND subject <> ''
+            GROUP BY subject
+            ORDER BY MAX(start_time) DESC
+        """, params):
+            stats["subjects"][subject] = {
+                "sessions": sessions,
+                "time": int(time_spent),
+                "avg_rating": round(avg_rating, 2) if avg_rating else 0
+            }
+        
+        # Session type breakdown
+        for session_type, sessions, time_spent in self.db.execute_query("""
+            SELECT session_type, COUNT(*), TOTAL(duration)
+            FROM sessions
+            WHERE start_time >= ? AND end_time IS NOT NULL
+            GROUP BY session_type
+            ORDER BY MAX(start_time) DESC
+        """, params):
+            stats["session_types"][session_type] = {"sessions": sessions, "time": int(time_spent)}
+        
+        # Daily breakdown
+        for day, sessions, time_spent in self.db.execute_query("""
+            SELECT substr(start_time, 1, 10) AS day, COUNT(*), TOTAL(duration)
+            FROM sessions
+            WHERE start_time >= ? AND end_time IS NOT NULL
+            GROUP BY day
+            ORDER BY day DESC
+        """, params):
+            stats["daily_breakdown"][day] = {"sessions": sessions, "time": int(time_spent)}
         
         return stats
     
-    def get_session_history(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent session history"""
+    def get_session_history(self, limit: int = 10) -> Dict[str, List[Any]]:
+        """Get recent session history as columns (one list per field, newest first)"""
         
         sessions = self.db.execute_query("""
             SELECT s.id, s.session_type, s.subject, s.start_time, s.end_time, 
@@ -307,38 +385,41 @@ class SessionManager:
             LIMIT ?
         """, (limit,))
         
-        history = []
-        for session in sessions:
-            session_id, session_type, subject, start_time, end_time, duration, rating, project = session
-            
-            # Format session data
-            session_data = {
-                "id": session_id,
-                "type": session_type,
-                "subject": subject,
-                "project": project,
-                "start_time": start_time,
-                "end_time": end_time,
-                "duration_minutes": round((duration or 0) / 60) if duration else 0,
-                "rating": rating,
-                "status": "completed" if end_time else "incomplete"
-            }
-            
-            history.append(session_data)
+        # Transpose rows into columns; an empty history gives empty columns
+        ids, types, subjects, start_times, end_times, durations, ratings, projects = (
+            zip(*sessions) if sessions else ((),) * 8
+        )
         
-        return history
+        return {
+            "id": list(ids),
+            "type": list(types),
+            "subject": list(subjects),
+            "project": list(projects),
+            "start_time": list(start_times),
+            "end_time": list(end_times),
+            "duration_minutes": [round(d / 60) if d else 0 for d in durations],
+            "rating": list(ratings),
+            "status": ["completed" if end else "incomplete" for end in end_times]
+        }
     
     def _get_project_id(self, project_name: str) -> Optional[int]:
-        """Get project ID by name"""
-        result = self.db.execute_query(
-            "SELECT id FROM projects WHERE name = ?", (project_name,)
-        )
-        return result[0][0] if result else None
+        """Get project ID by name, remembering misses as well as hits"""
+        if project_name not in self._project_ids:
+            result = self.db.execute_query(
+                "SELECT id FROM projects WHERE name = ?", (project_name,)
+            )
+            self._project_ids[project_name] = result[0][0] if result else None
+        return self._project_ids[project_name]
+    
+    @classmethod
+    def invalidate_project_cache(cls):
+        """Forget cached project ids; called whenever projects are created, changed or deleted"""
+        cls._project_ids.clear()
     
     def _create_session_record(self, session_data: Dict[str, Any]) -> int:
         """Create a new session record in database"""
         
-        result = self.db.execute_update("""
+        return self.db.execute_insert("""
             INSERT INTO sessions (session_type, project_id, subject, start_time, duration)
             VALUES (?, ?, ?, ?, ?)
         """, (
@@ -348,10 +429,6 @@ class SessionManager:
             session_data["start_time"],
             session_data.get("duration")
         ))
-        
-        # Get the ID of the inserted record
-        session_id = self.db.execute_query("SELECT last_insert_rowid()")[0][0]
-        return session_id
     
     def _check_achievements(self):
         """Check and display achievement unlocks"""
@@ -359,22 +436,28 @@ class SessionManager:
         now = datetime.now()
         today = now.date()
         
-        # Get recent sessions to calculate streak
+        # Recent session days and the finished-session count in one query; there are
+        # no recent days exactly when there are no finished sessions
         recent_sessions = self.db.execute_query("""
-            SELECT DISTINCT DATE(start_time) as session_date 
-            FROM sessions 
-            WHERE end_time IS NOT NULL 
-            ORDER BY session_date DESC
-            LIMIT 30
+            WITH recent AS (
+                SELECT DISTINCT DATE(start_time) AS session_date
+                FROM sessions
+                WHERE end_time IS NOT NULL
+                ORDER BY session_date DESC
+                LIMIT 30
+            )
+            SELECT session_date,
+                   (SELECT COUNT(*) FROM sessions WHERE end_time IS NOT NULL) AS total_sessions
+            FROM recent
         """)
         
-        # Calculate consecutive days
+        # Calculate consecutive days, comparing ISO date strings
         streak_days = 0
         check_date = today
         
-        session_dates = [datetime.fromisoformat(s[0] + "T00:00:00").date() for s in recent_sessions]
+        session_dates = {s[0] for s in recent_sessions}
         
-        while check_date in session_dates:
+        while check_date.isoformat() in session_dates:
             streak_days += 1
             check_date = check_date - timedelta(days=1)
         
@@ -402,9 +485,7 @@ class SessionManager:
             })
         
         # Check session milestones
-        total_sessions = self.db.execute_query(
-            "SELECT COUNT(*) FROM sessions WHERE end_time IS NOT NULL"
-        )[0][0]
+        total_sessions = recent_sessions[0][1] if recent_sessions else 0
         
         if total_sessions == 10:
             self.interactive_ui.show_achievement_unlock({
@@ -430,10 +511,10 @@ class SessionManager:
     
     def _play_completion_sound(self):
         """Play completion sound if enabled"""
-        if self.config.get("session.notification_sound", True):
-            # Simple beep sound for completion
+        if self.notification_sound:
+            # Simple beep sound for completion: write the terminal bell directly
             try:
-                import os
-                os.system("echo -e '\a'")  # Terminal bell
-            except:
+                sys.stdout.write("\a")
+                sys.stdout.flush()
+            except (OSError, ValueError):
                 pass  # Ignore if sound fails
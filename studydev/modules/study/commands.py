@@ -10,7 +10,7 @@ from rich.text import Text
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 
-from studydev.modules.study.manager import StudyMaterialsManager
+from studydev.utils.dashboard_cache import invalidate_dashboard_cache
 
 console = Console()
 
@@ -32,6 +32,7 @@ def manage_bookmarks(
     unread_only: bool = typer.Option(False, help="Show only unread bookmarks (for list)")
 ):
     """🔖 Manage study resource bookmarks"""
+    from studydev.modules.study.manager import StudyMaterialsManager
     manager = StudyMaterialsManager()
     
     if action == "add":
@@ -172,6 +173,7 @@ def manage_flashcards(
     limit: int = typer.Option(10, help="Limit for review session")
 ):
     """🎴 Manage flashcards with spaced repetition system"""
+    from studydev.modules.study.manager import StudyMaterialsManager
     manager = StudyMaterialsManager()
     
     if action == "add":
@@ -254,6 +256,8 @@ def manage_flashcards(
                 else:
                     console.print("📅 Next review: Tomorrow (incorrect answer)")
         
+        invalidate_dashboard_cache()
+        
         # Session summary
         accuracy = (correct_count / total_cards) * 100
         console.print(f"\n🎆 [bold]Review Session Complete![/bold]")
@@ -331,6 +335,7 @@ def manage_courses(
     target_date: str = typer.Option(None, help="Target completion date (YYYY-MM-DD)")
 ):
     """🎓 Track online course progress"""
+    from studydev.modules.study.manager import StudyMaterialsManager
     manager = StudyMaterialsManager()
     
     if action == "add":
@@ -375,11 +380,11 @@ def manage_courses(
             # Progress bar
             progress_pct = course["progress_percentage"]
             if progress_pct >= 100:
-                progress_display = "[green]✅ 100%[/green]"
+                progress_display = Text("✅ 100%", style="green")
             elif progress_pct >= 50:
-                progress_display = f"[yellow]🔄 {progress_pct:.1f}%[/yellow]"
+                progress_display = Text(f"🔄 {progress_pct:.1f}%", style="yellow")
             else:
-                progress_display = f"[red]📚 {progress_pct:.1f}%[/red]"
+                progress_display = Text(f"📚 {progress_pct:.1f}%", style="red")
             
             # Status icons
             status_icons = {
@@ -451,6 +456,7 @@ def review_materials(
     limit: int = typer.Option(10, help="Maximum items to show")
 ):
     """📜 Review study materials (flashcards, bookmarks, etc.)"""
+    from studydev.modules.study.manager import StudyMaterialsManager
     manager = StudyMaterialsManager()
     
     # Get review summary
@@ -10,12 +10,9 @@ import random
 import math
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.prompt import Prompt, Confirm
 
-from studydev.core.config import Config
-from studydev.core.database import Database
+from studydev.core.config import get_config
+from studydev.core.database import get_db
 
 console = Console()
 
@@ -23,8 +20,8 @@ class StudyMaterialsManager:
     """Manages study materials, bookmarks, flashcards, and courses"""
     
     def __init__(self):
-        self.config = Config()
-        self.db = Database()
+        self.config = get_config()
+        self.db = get_db()
     
     # ================================
     # BOOKMARK MANAGEMENT
@@ -45,13 +42,11 @@ class StudyMaterialsManager:
         # Insert bookmark
         tags_json = json.dumps(tags or [])
         
-        self.db.execute_update("""
+        bookmark_id = self.db.execute_insert("""
             INSERT INTO bookmarks (title, url, description, category, tags, created_at)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (title, url, description, category, tags_json, datetime.now().isoformat()))
         
-        bookmark_id = self.db.execute_query("SELECT last_insert_rowid()")[0][0]
-        
         return {
             "success": True,
             "bookmark_id": bookmark_id,
@@ -180,7 +175,7 @@ class StudyMaterialsManager:
         # Calculate initial review date (tomorrow)
         next_review = (datetime.now() + timedelta(days=1)).date().isoformat()
         
-        self.db.execute_update("""
+        flashcard_id = self.db.execute_insert("""
             INSERT INTO flashcards (
                 question, answer, subject, difficulty, next_review, 
                 tags, created_at
@@ -190,8 +185,6 @@ class StudyMaterialsManager:
             tags_json, datetime.now().isoformat()
         ))
         
-        flashcard_id = self.db.execute_query("SELECT last_insert_rowid()")[0][0]
-        
         return {
             "success": True,
             "flashcard_id": flashcard_id,
@@ -360,19 +353,17 @@ class StudyMaterialsManager:
                   target_completion_date: str = None) -> Dict[str, Any]:
         """Add a new course"""
         
-        self.db.execute_update("""
+        now_iso = datetime.now().isoformat()
+        course_id = self.db.execute_insert("""
             INSERT INTO courses (
                 title, platform, instructor, url, total_lessons, 
                 target_completion_date, created_at, updated_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             title, platform, instructor, url, total_lessons,
-            target_completion_date, datetime.now().isoformat(),
-            datetime.now().isoformat()
+            target_completion_date, now_iso, now_iso
         ))
         
-        course_id = self.db.execute_query("SELECT last_insert_rowid()")[0][0]
-        
         return {
             "success": True,
             "course_id": course_id,
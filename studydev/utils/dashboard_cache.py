@@ -0,0 +1,61 @@
+"""
+StudyDev Dashboard Cache
+Short-lived on-disk cache of dashboard data shared by `status` and `dashboard`
+"""
+
+import os
+import time
+import pickle
+from datetime import date
+from pathlib import Path
+from typing import Dict, Any
+
+from studydev.core.config import get_config
+from studydev.core.database import database_file_marker
+
+# Seconds a cached dashboard stays valid
+DEFAULT_TTL = 60
+
+
+def _cache_file() -> Path:
+    """Location of the pickled dashboard data"""
+    return get_config().cache_dir / "dashboard.pkl"
+
+
+def get_dashboard_data(integration=None, ttl: int = DEFAULT_TTL) -> Dict[str, Any]:
+    """Get dashboard data from the cache, regenerating it when stale"""
+    cache_file = _cache_file()
+    key = (database_file_marker(), date.today().isoformat())
+    
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            with open(cache_file, 'rb') as f:
+                cached_key, data = pickle.load(f)
+            if cached_key == key:
+                return data
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass  # Missing or unreadable cache, fall through and rebuild
+    
+    if integration is None:
+        from studydev.utils.integration import IntegrationManager
+        integration = IntegrationManager()
+    
+    data = integration.generate_dashboard_data()
+    
+    try:
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best effort
+    
+    return data
+
+
+def invalidate_dashboard_cache():
+    """Drop the cached dashboard data after data changes"""
+    try:
+        _cache_file().unlink()
+    except FileNotFoundError:
+        pass
@@ -9,12 +9,9 @@ from typing import Dict, List, Any, Optional, Tuple
 import math
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
 
-from studydev.core.config import Config
-from studydev.core.database import Database
+from studydev.core.config import get_config
+from studydev.core.database import get_db
 
 console = Console()
 
@@ -22,8 +19,8 @@ class IntegrationManager:
     """Manages cross-module functionality and report generation"""
     
     def __init__(self):
-        self.config = Config()
-        self.db = Database()
+        self.config = get_config()
+        self.db = get_db()
     
     def generate_productivity_report(self, days: int = 30) -> Dict[str, Any]:
         """Generate comprehensive productivity report across all modules"""
@@ -641,6 +638,17 @@ class IntegrationManager:
             "sessions": session_stats
         }
     
+    def count_due_soon(self, days: int = 7) -> int:
+        """Count open projects with a deadline within the next `days` days (or overdue)"""
+        target_date = (date.today() + timedelta(days=days)).isoformat()
+        
+        return self.db.execute_query("""
+            SELECT COUNT(*) FROM projects
+            WHERE deadline IS NOT NULL
+                AND deadline <= ?
+                AND status NOT IN ('completed', 'cancelled')
+        """, (target_date,))[0][0]
+    
     def generate_dashboard_data(self) -> Dict[str, Any]:
         """Generate data for the StudyDev dashboard"""
         
@@ -662,8 +670,7 @@ class IntegrationManager:
             FROM projects 
             WHERE deadline IS NOT NULL 
                 AND deadline <= ? 
-                AND status != 'completed'
-                AND status != 'cancelled'
+                AND status NOT IN ('completed', 'cancelled')
             ORDER BY deadline ASC
             LIMIT 5
         """, (target_date,))
@@ -680,22 +687,21 @@ class IntegrationManager:
                 "days_left": days_left
             })
         
-        # Get session streaks (consecutive days with sessions)
+        # Get session streaks (consecutive days with sessions), walking session days
+        # newest first off the start_time index and stopping at the first gap
         streak = 0
-        current_date = date.today()
+        expected_day = date.today()
         
-        while True:
-            check_date = (current_date - timedelta(days=streak)).isoformat()
-            
-            sessions = self.db.execute_query("""
-                SELECT COUNT(*) FROM sessions 
-                WHERE DATE(start_time) = ?
-            """, (check_date,))[0][0]
-            
-            if sessions > 0:
-                streak += 1
-            else:
+        for (day,) in self.db.execute_query_iter("""
+            SELECT substr(start_time, 1, 10) FROM sessions
+            ORDER BY start_time DESC
+        """, batch_size=64):
+            if day > expected_day.isoformat():
+                continue  # Later session on a day already counted (or in the future)
+            if day != expected_day.isoformat():
                 break
+            streak += 1
+            expected_day -= timedelta(days=1)
         
         # Get recent sessions
         recent_sessions = self.db.execute_query("""
@@ -727,6 +733,7 @@ class IntegrationManager:
         return {
             "flashcards_due": flashcards_due,
             "upcoming_deadlines": deadlines,
+            "due_soon": self.count_due_soon(7),
             "current_streak": streak,
             "recent_sessions": sessions,
             "recent_stats": {
@@ -3,6 +3,8 @@ StudyDev Interactive UI Utilities
 Enhanced interactive features and beautiful terminal formatting
 """
 
+import os
+import sys
 import time
 import random
 from typing import List, Dict, Any, Optional
@@ -12,8 +14,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt
 from rich.align import Align
 from rich.layout import Layout
 from rich.live import Live
@@ -23,6 +24,18 @@ from rich.rule import Rule
 
 console = Console()
 
+
+def animations_enabled() -> bool:
+    """Animations only run on an interactive terminal and can be disabled via STUDYDEV_NO_ANIMATION"""
+    return sys.stdout.isatty() and not os.environ.get("STUDYDEV_NO_ANIMATION")
+
+
+def _pause(seconds: float):
+    """Sleep between animation frames, skipped when animations are disabled"""
+    if animations_enabled():
+        time.sleep(seconds)
+
+
 class InteractiveUI:
     """Enhanced interactive UI components for StudyDev"""
     
@@ -99,10 +112,10 @@ class InteractiveUI:
                 )
                 
                 live.update(panel)
-                time.sleep(0.3)
+                _pause(0.3)
         
         # Final pause
-        time.sleep(1)
+        _pause(1)
     
     def create_productivity_gauge(self, score: float, max_score: float = 5.0) -> Panel:
         """Create a beautiful productivity gauge"""
@@ -201,7 +214,7 @@ class InteractiveUI:
                 )
                 
                 live.update(panel)
-                time.sleep(0.1)
+                _pause(0.1)
     
     def create_progress_visualization(self, data: Dict[str, Any]) -> Layout:
         """Create a comprehensive progress visualization"""
@@ -302,7 +315,7 @@ class InteractiveUI:
                 )
                 
                 live.update(panel)
-                time.sleep(0.15)
+                _pause(0.15)
     
     def create_interactive_menu(self, title: str, options: List[Dict[str, str]], 
                               style: str = "blue") -> str:
@@ -335,6 +348,10 @@ class InteractiveUI:
     def show_loading_animation(self, message: str, duration: float = 2.0):
         """Show a beautiful loading animation"""
         
+        # Purely decorative delay; skip it for scripts and piped output
+        if not animations_enabled():
+            return
+        
         spinners = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         
         with Live(console=console, refresh_per_second=10) as live:
@@ -355,7 +372,7 @@ class InteractiveUI:
                 )
                 
                 live.update(panel)
-                time.sleep(0.1)
+                _pause(0.1)
     
     def create_help_display(self, commands: Dict[str, Dict[str, str]]) -> None:
         """Create a beautiful help display with command categories"""
@@ -420,10 +437,10 @@ class InteractiveUI:
                 )
                 
                 live.update(panel)
-                time.sleep(0.1)
+                _pause(0.1)
         
         # Hold final frame
-        time.sleep(1)
+        _pause(1)
     
     def create_status_summary(self, data: Dict[str, Any]) -> Panel:
         """Create a comprehensive status summary panel"""
@@ -39,6 +39,32 @@ class TestConfig:
         
         assert retrieved_value == test_value
 
+    def test_config_cache_sees_saved_values(self):
+        """Test that a new Config picks up values saved by another instance"""
+        config = Config()
+        config.set('test.cached', 'cached_data')
+        config.flush()
+
+        assert Config().get('test.cached') == 'cached_data'
+
+    def test_config_cache_ignores_unsaved_values(self):
+        """Test that values not yet written are local to their Config instance"""
+        value = f'unsaved_{os.getpid()}'
+        config = Config()
+        config.set('test.unsaved', value)
+
+        assert config.get('test.unsaved') == value
+        assert Config().get('test.unsaved') != value
+
+    def test_config_batch_set(self):
+        """Test setting several values with one write"""
+        config = Config()
+        config.batch_set({'test.batch_a': 1, 'test.batch_b': 'two'})
+
+        fresh = Config()
+        assert fresh.get('test.batch_a') == 1
+        assert fresh.get('test.batch_b') == 'two'
+
 
 class TestDatabase:
     """Test database functionality"""
@@ -72,7 +98,89 @@ class TestDatabase:
         assert 'bookmarks' in table_names
         assert 'flashcards' in table_names
         assert 'courses' in table_names
-    
+
+    def test_stats_cache_invalidated_on_write(self):
+        """Test that cached stats are refreshed after a write"""
+        db = Database()
+        before = db.get_stats()['bookmarks']
+
+        db.execute_update("""
+            INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+        """, ('Stats Test', 'https://example.com', 'test'))
+        assert db.get_stats()['bookmarks'] == before + 1
+
+        db.execute_update("DELETE FROM bookmarks WHERE title = ?", ('Stats Test',))
+        assert db.get_stats()['bookmarks'] == before
+
+    def test_execute_insert_returns_id(self):
+        """Test that execute_insert returns the id of the new row"""
+        db = Database()
+        bookmark_id = db.execute_insert("""
+            INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+        """, ('Insert Id', 'https://example.com', 'insert-id-test'))
+
+        rows = db.execute_query("SELECT category FROM bookmarks WHERE id = ?", (bookmark_id,))
+        assert rows[0][0] == 'insert-id-test'
+
+        db.execute_update("DELETE FROM bookmarks WHERE id = ?", (bookmark_id,))
+
+    def test_execute_many(self):
+        """Test bulk inserts in a single transaction"""
+        db = Database()
+        rows = [(f'Bulk {i}', 'https://example.com', 'bulk-test') for i in range(50)]
+
+        inserted = db.execute_many("""
+            INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+        """, rows)
+        assert inserted == 50
+
+        deleted = db.execute_update("DELETE FROM bookmarks WHERE category = ?", ('bulk-test',))
+        assert deleted == 50
+
+    def test_execute_many_rolls_back_failed_batch(self):
+        """Test that a row generator failing mid-batch leaves nothing behind"""
+        db = Database()
+        before = db.get_stats()['bookmarks']
+
+        def rows():
+            yield ('Bulk Fail', 'https://example.com', 'bulk-fail-test')
+            raise ValueError("bad row")
+
+        with pytest.raises(ValueError):
+            db.execute_many("""
+                INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+            """, rows())
+
+        assert db.conn.in_transaction is False
+        # A later unrelated write must not commit the abandoned rows
+        db.execute_update("DELETE FROM bookmarks WHERE category = ?", ('no-such-category',))
+        assert db.execute_query(
+            "SELECT COUNT(*) FROM bookmarks WHERE category = ?", ('bulk-fail-test',)
+        )[0][0] == 0
+        assert db.get_stats()['bookmarks'] == before
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test that a failed transaction leaves no partial writes"""
+        db = Database()
+        before = db.get_stats()['bookmarks']
+
+        with pytest.raises(RuntimeError):
+            with db.transaction() as cursor:
+                cursor.execute("""
+                    INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+                """, ('Tx Test', 'https://example.com', 'tx-test'))
+                raise RuntimeError("abort")
+
+        assert db.get_stats()['bookmarks'] == before
+
+        with db.transaction() as cursor:
+            cursor.execute("""
+                INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+            """, ('Tx Test', 'https://example.com', 'tx-test'))
+            cursor.execute("DELETE FROM bookmarks WHERE category = ?", ('tx-test',))
+
+        assert db.get_stats()['bookmarks'] == before
+
     def test_database_insert_and_query(self):
         """Test basic database operations"""
         db = Database()
@@ -104,6 +212,24 @@ class TestCLICommands:
         assert result.returncode == 0
         assert 'StudyDev' in result.stdout
     
+    def test_help_does_not_import_subapps(self):
+        """Test that top-level help is rendered without importing sub-app modules"""
+        import subprocess
+        import sys
+        code = (
+            "import sys\n"
+            "from studydev.main import app\n"
+            "try:\n"
+            "    app(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('studydev.modules')))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        assert result.returncode == 0
+        assert 'session' in result.stdout
+        assert result.stdout.strip().endswith('[]')
+    
     def test_version_command(self):
         """Test that version command works"""
         import subprocess
@@ -111,6 +237,16 @@ class TestCLICommands:
         assert result.returncode == 0
         assert 'StudyDev' in result.stdout
 
+    def test_config_value_parsing(self):
+        """Test that config values from the command line get sensible types"""
+        from studydev.main import _parse_config_value
+
+        assert _parse_config_value('True') is True
+        assert _parse_config_value('-5') == -5
+        assert _parse_config_value('2.5') == 2.5
+        assert _parse_config_value('1.2.3') == '1.2.3'
+        assert _parse_config_value('nan') == 'nan'
+
 
 class TestSessionManager:
     """Test session management functionality"""
@@ -158,6 +294,58 @@ class TestProjectManager:
         # Should have at least some default templates
         assert len(templates) > 0
 
+    def test_project_list_cache_invalidated_on_update(self):
+        """Test that cached project lists reflect updates"""
+        from studydev.modules.project.manager import ProjectManager
+
+        project_manager = ProjectManager()
+        with tempfile.TemporaryDirectory() as tmp:
+            result = project_manager.create_project('Cache Test Project', path=tmp)
+            project_id = result['project_id']
+            try:
+                assert project_manager.get_project(project_id)['status'] == 'active'
+                project_manager.list_projects()
+
+                project_manager.update_project(project_id, status='paused')
+                statuses = {p['id']: p['status'] for p in project_manager.list_projects()}
+                assert statuses[project_id] == 'paused'
+            finally:
+                project_manager.delete_project(project_id)
+
+    def test_project_changes_clear_session_project_ids(self):
+        """Test that project changes drop the session manager's cached project ids"""
+        from studydev.modules.project.manager import ProjectManager
+        from studydev.modules.session.manager import SessionManager
+
+        project_manager = ProjectManager()
+        with tempfile.TemporaryDirectory() as tmp:
+            SessionManager._project_ids['Stale Project'] = 1
+            project_id = project_manager.create_project('Session Cache Project', path=tmp)['project_id']
+            try:
+                assert 'Stale Project' not in SessionManager._project_ids
+            finally:
+                project_manager.delete_project(project_id)
+
+    def test_update_project_single_statement(self):
+        """Test that updating several fields issues one UPDATE"""
+        from unittest import mock
+        from studydev.modules.project.manager import ProjectManager
+
+        project_manager = ProjectManager()
+        with tempfile.TemporaryDirectory() as tmp:
+            project_id = project_manager.create_project('Update Test Project', path=tmp)['project_id']
+            try:
+                with mock.patch.object(project_manager.db, 'execute_update',
+                                       wraps=project_manager.db.execute_update) as execute_update:
+                    result = project_manager.update_project(project_id, status='paused', priority=5)
+
+                assert result['success'] is True
+                assert execute_update.call_count == 1
+                project = project_manager.get_project(project_id)
+                assert (project['status'], project['priority']) == ('paused', 5)
+            finally:
+                project_manager.delete_project(project_id)
+
 
 class TestStudyManager:
     """Test study materials functionality"""
@@ -228,7 +416,41 @@ class TestIntegration:
         assert 'recent_stats' in dashboard_data
         assert 'current_streak' in dashboard_data
         assert 'flashcards_due' in dashboard_data
-    
+
+    def test_dashboard_cache(self):
+        """Test that dashboard data is served from the cache until data changes"""
+        import time
+        from unittest import mock
+        from studydev.utils.dashboard_cache import (
+            get_dashboard_data, invalidate_dashboard_cache, _cache_file
+        )
+
+        integration = mock.Mock()
+        integration.generate_dashboard_data.return_value = {'current_streak': 3}
+
+        invalidate_dashboard_cache()
+        fresh = get_dashboard_data(integration)
+        assert integration.generate_dashboard_data.call_count == 1
+        assert _cache_file().exists()
+
+        cached = get_dashboard_data(integration)
+        assert cached == fresh
+        assert integration.generate_dashboard_data.call_count == 1
+
+        invalidate_dashboard_cache()
+        get_dashboard_data(integration)
+        assert integration.generate_dashboard_data.call_count == 2
+
+        # A committed write changes the database marker and so the cache key
+        time.sleep(0.05)  # Step past coarse filesystem mtime granularity
+        db = Database()
+        db.execute_update("""
+            INSERT INTO bookmarks (title, url, category) VALUES (?, ?, ?)
+        """, ('Cache Test', 'https://example.com', 'dashboard-cache-test'))
+        db.execute_update("DELETE FROM bookmarks WHERE category = ?", ('dashboard-cache-test',))
+        get_dashboard_data(integration)
+        assert integration.generate_dashboard_data.call_count == 3
+
     def test_productivity_report_structure(self):
         """Test productivity report generation"""
         from studydev.utils.integration import IntegrationManager